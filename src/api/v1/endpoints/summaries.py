@@ -24,6 +24,9 @@ from src.models.transcript import MeetingSummary, TranscriptStatus
 
 router = APIRouter()
 
+# Export configuration
+SUPPORTED_EXPORT_FORMATS = frozenset({"json", "markdown", "pdf"})
+
 
 class ExportRequest(BaseModel):
     """Request model for summary export."""
@@ -480,7 +483,7 @@ async def export_summary(request: ExportRequest):
         api_logger.info(f"Export requested: {meeting_id} as {export_format}")
 
         # Validate format
-        if export_format not in ["json", "markdown", "pdf"]:
+        if export_format not in SUPPORTED_EXPORT_FORMATS:
             raise ValidationError(
                 {"format": "Unsupported format. Use: json, markdown, or pdf"}
             )
@@ -557,7 +560,7 @@ async def bulk_export_summaries(request: BulkExportRequest):
         )
 
         # Validate format
-        if export_format not in ["json", "markdown", "pdf"]:
+        if export_format not in SUPPORTED_EXPORT_FORMATS:
             raise ValidationError(
                 {"format": "Unsupported format. Use: json, markdown, or pdf"}
             )
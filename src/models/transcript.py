@@ -7,6 +7,8 @@ from uuid import UUID, uuid4
 
 from pydantic import Field, computed_field, field_validator
 
+from src.utils.text import normalize_participants
+
 from .action_item import ActionItem
 from .base import BaseModelWithConfig, TimestampedModel
 from .decision import Decision
@@ -116,15 +118,7 @@ class TranscriptInput(BaseModelWithConfig):
         if not v:
             raise ValueError("At least one participant is required")
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_participants = []
-        for participant in v:
-            participant = participant.strip()
-            if participant and participant.lower() not in seen:
-                seen.add(participant.lower())
-                unique_participants.append(participant)
-
+        unique_participants = normalize_participants(v)
         if not unique_participants:
             raise ValueError("At least one valid participant is required")
 
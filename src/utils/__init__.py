@@ -0,0 +1,5 @@
+"""Shared helpers with no dependencies on models or services."""
+
+from .text import normalize_participants
+
+__all__ = ["normalize_participants"]
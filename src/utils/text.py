@@ -0,0 +1,27 @@
+"""Text normalization helpers."""
+
+from collections.abc import Iterable
+
+
+def normalize_participants(names: Iterable[str]) -> list[str]:
+    """
+    Strip and deduplicate participant names, preserving first-seen order.
+
+    Names are compared case-insensitively; the first spelling is kept and
+    blank entries are dropped.
+
+    Args:
+        names: Raw participant names
+
+    Returns:
+        List of cleaned, unique participant names
+    """
+    seen: set[str] = set()
+    unique_names = []
+    for name in names:
+        name = name.strip()
+        key = name.casefold()
+        if name and key not in seen:
+            seen.add(key)
+            unique_names.append(name)
+    return unique_names
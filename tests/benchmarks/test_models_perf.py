@@ -0,0 +1,30 @@
+"""Micro-benchmarks for hot model construction paths.
+
+Skipped by a plain ``pytest`` run; run them with
+``pytest tests/benchmarks --benchmark-only``.
+"""
+
+from src.models.base import PaginatedResponse
+from src.models.decision import Decision
+from tests.utils.factories import DECISION_DEFAULTS
+
+PAGE_ITEMS = list(range(20))
+
+
+def test_benchmark_decision_init(benchmark):
+    """Benchmark validating a Decision from known-good data."""
+    decision = benchmark.pedantic(
+        Decision, kwargs=DECISION_DEFAULTS, rounds=200, iterations=50
+    )
+    assert decision.decision == DECISION_DEFAULTS["decision"]
+
+
+def test_benchmark_paginated_create(benchmark):
+    """Benchmark building a PaginatedResponse through its create() helper."""
+    response = benchmark.pedantic(
+        PaginatedResponse.create,
+        kwargs={"items": PAGE_ITEMS, "total": 100},
+        rounds=200,
+        iterations=50,
+    )
+    assert response.pages == 5
@@ -1,15 +1,102 @@
 """Test configuration and fixtures."""
 
+from datetime import UTC, datetime
+
 import pytest
 from fastapi.testclient import TestClient
 
-from src.main import app
+FROZEN_NOW = datetime(2025, 1, 15, 12, 0, tzinfo=UTC)
 
 
-@pytest.fixture
+def pytest_addoption(parser):
+    """Register the --fast smoke-run option."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="build transcript models without validation and skip tests "
+        "marked needs_validation",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked needs_validation when running with --fast."""
+    if not config.getoption("--fast"):
+        return
+    skip_validation = pytest.mark.skip(reason="needs validation; skipped under --fast")
+    for item in items:
+        if item.get_closest_marker("needs_validation"):
+            item.add_marker(skip_validation)
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Test client fixture."""
-    return TestClient(app)
+    """Test client fixture.
+
+    Entered as a context manager once per session, so the app lifespan runs
+    once and the client is reused across every test module. The app is
+    imported here rather than at module level, so collection and runs that
+    never request a client skip building it.
+    """
+    from src.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def now_utc():
+    """Fixture providing the current UTC time, read once per session.
+
+    Use it for "some past/future time" arithmetic; tests that bracket a
+    timestamp between before/after reads still need the real clock.
+    """
+    return datetime.now(UTC)
+
+
+@pytest.fixture
+def frozen_now(time_machine):
+    """Fixture pinning the clock to a fixed UTC instant for the test.
+
+    The clock does not tick, so timestamps taken during the test equal the
+    returned value exactly; use time_machine.shift() to move it forward.
+    """
+    time_machine.move_to(FROZEN_NOW, tick=False)
+    return FROZEN_NOW
+
+
+@pytest.fixture
+def serve_summary(monkeypatch):
+    """Fixture returning a helper that serves a summary from the in-memory store.
+
+    monkeypatch.setitem records each insertion and undoes it on teardown,
+    which is much cheaper than entering a mock.patch context per test. The
+    stores are imported here, like the app in client(), so collection does
+    not load the routers.
+    """
+    from src.api.v1.endpoints.transcripts import (
+        meetings_storage,
+        processing_status_storage,
+        summaries_storage,
+    )
+    from src.models.transcript import (
+        MeetingSummary,
+        ProcessingStatus,
+        TranscriptStatus,
+    )
+
+    def _serve(summary: MeetingSummary) -> MeetingSummary:
+        meeting_id = summary.meeting_id
+        monkeypatch.setitem(meetings_storage, meeting_id, {"meeting_id": meeting_id})
+        monkeypatch.setitem(
+            processing_status_storage,
+            meeting_id,
+            ProcessingStatus(meeting_id=meeting_id, status=TranscriptStatus.COMPLETED),
+        )
+        monkeypatch.setitem(summaries_storage, meeting_id, summary)
+        return summary
+
+    return _serve
 
 
 @pytest.fixture
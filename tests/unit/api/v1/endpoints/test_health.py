@@ -2,6 +2,10 @@
 
 import pytest
 
+# Remove once the endpoints are implemented
+pytestmark = pytest.mark.skip(reason="Endpoint not implemented yet")
+
+
 # Import will be available after implementation
 # from src.main import app
 
@@ -31,7 +35,6 @@ class TestHealthEndpoint:
         #         "database": "healthy"
         #     }
         # }
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_return_degraded_status_when_database_unavailable(self, client):
         """Test health check returns degraded when database is down."""
@@ -44,7 +47,6 @@ class TestHealthEndpoint:
         #     assert response.json()["status"] == "degraded"
         #     assert response.json()["checks"]["database"] == "unhealthy"
         #     assert response.json()["checks"]["api"] == "healthy"
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_include_system_information(self, client):
         """Test health check includes system information."""
@@ -55,14 +57,12 @@ class TestHealthEndpoint:
         # assert "timestamp" in data
         # assert "uptime" in data
         # assert isinstance(data["uptime"], (int, float))
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_return_json_content_type(self, client):
         """Test health check returns proper content type."""
         # response = client.get("/api/v1/health")
 
         # assert response.headers["content-type"] == "application/json"
-        pytest.skip("Endpoint not implemented yet")
 
 
 class TestReadinessEndpoint:
@@ -77,7 +77,6 @@ class TestReadinessEndpoint:
         #     "status": "ready",
         #     "timestamp": pytest.approx(datetime.now().isoformat(), abs=1)
         # }
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_return_not_ready_during_startup(self, client):
         """Test readiness probe returns not ready during startup."""
@@ -88,7 +87,6 @@ class TestReadinessEndpoint:
         #
         #     assert response.status_code == 503
         #     assert response.json()["status"] == "not_ready"
-        pytest.skip("Endpoint not implemented yet")
 
 
 class TestLivenessEndpoint:
@@ -100,7 +98,6 @@ class TestLivenessEndpoint:
 
         # assert response.status_code == 200
         # assert response.json() == {"status": "alive"}
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_be_lightweight_and_fast(self, client):
         """Test liveness probe is lightweight and responds quickly."""
@@ -112,4 +109,3 @@ class TestLivenessEndpoint:
         # elapsed_time = time.time() - start_time
         # assert elapsed_time < 0.1  # Should respond in under 100ms
         # assert response.status_code == 200
-        pytest.skip("Endpoint not implemented yet")
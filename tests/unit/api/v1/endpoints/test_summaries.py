@@ -1,82 +1,140 @@
 """Comprehensive tests for summary endpoints."""
 
-from datetime import UTC, datetime
+from datetime import datetime, timedelta
 
 import pytest
 
-from src.models.action_item import ActionItem, ActionItemPriority, ActionItemStatus
-from src.models.decision import Decision, DecisionImpact
+from src.models.action_item import ActionItemPriority, ActionItemStatus
+from src.models.decision import DecisionImpact
 from src.models.transcript import MeetingSummary
+from tests.utils.factories import make_action_item, make_decision, make_meeting_summary
 
-# Import will be available after implementation
-# from src.main import app
+# Remove once the endpoints are implemented
+endpoint_not_implemented = pytest.mark.skip(reason="Endpoint not implemented yet")
 
 
-@pytest.fixture
-def client():
-    """Test client fixture."""
-    # Will be implemented after main app is ready
-    # return TestClient(app)
-    pass
+# Fields regenerated on every construction; excluded when comparing builds
+_VOLATILE_FIELDS = {
+    "id": True,
+    "created_at": True,
+    "action_items": {"__all__": {"id", "created_at"}},
+    "decisions": {"__all__": {"id", "created_at", "timestamp"}},
+}
 
 
-@pytest.fixture
-def sample_meeting_summary():
-    """Fixture providing a sample meeting summary."""
-    return MeetingSummary(
-        meeting_id="summary_test_123",
+def build_sample_meeting_summary(
+    now: datetime, validate: bool = True
+) -> MeetingSummary:
+    """Build the sample meeting summary, optionally skipping validation."""
+    return make_meeting_summary(
+        validate=validate,
         summary="Team discussed Q1 goals and project timelines. Key decisions made about technology stack.",
         key_topics=["Q1 Planning", "Technology Stack", "Timeline Review"],
         participants=["Alice Johnson", "Bob Smith", "Carol Davis"],
         action_items=[
-            ActionItem(
-                task="Complete budget analysis",
-                assignee="Alice Johnson",
-                status=ActionItemStatus.PENDING,
+            make_action_item(
+                validate=validate,
                 priority=ActionItemPriority.HIGH,
-                due_date=datetime.now(UTC).replace(hour=23, minute=59, second=59),
+                # A day ahead, so a run crossing UTC midnight stays in the future
+                due_date=now + timedelta(days=1),
             ),
-            ActionItem(
+            make_action_item(
+                validate=validate,
                 task="Set up development environment",
                 assignee="Bob Smith",
                 status=ActionItemStatus.IN_PROGRESS,
-                priority=ActionItemPriority.MEDIUM,
             ),
         ],
-        decisions=[
-            Decision(
-                decision="Use React for frontend framework",
-                made_by="Carol Davis (Tech Lead)",
-                rationale="Better team expertise and component reusability",
-                impact=DecisionImpact.HIGH,
-            )
-        ],
+        decisions=[make_decision(validate=validate, impact=DecisionImpact.HIGH)],
         confidence_score=0.89,
         processing_time_seconds=15.3,
     )
 
 
+@pytest.fixture
+def sample_meeting_summary(now_utc):
+    """Fixture providing a sample meeting summary.
+
+    Dates derive from the session-wide now_utc: ActionItem rejects due dates
+    in the past, so a fixed calendar date won't do, and one clock read keeps
+    summaries identical across tests.
+
+    The data is known-valid, so it is built with model_construct() to skip
+    validation; TestSummaryFixtures guards against schema drift.
+    """
+    return build_sample_meeting_summary(now_utc, validate=False)
+
+
+def _check_json_export(response):
+    """Check a JSON export body."""
+    data = response.json()
+    assert data["meeting_id"] == "summary_test_123"
+    assert "action_items" in data
+    assert "decisions" in data
+
+
+def _check_markdown_export(response):
+    """Check a Markdown export body."""
+    content = response.content.decode()
+    assert "# Meeting Summary" in content
+    assert "## Action Items" in content
+    assert "## Decisions Made" in content
+
+
+def _check_pdf_export(response):
+    """Check a PDF export body."""
+    assert response.headers["content-disposition"].startswith("attachment")
+    assert len(response.content) > 0
+
+
+def _check_invalid_format(response):
+    """Check rejection of an unsupported export format."""
+    assert response.status_code == 422
+    data = response.json()
+    assert data["success"] is False
+    assert "invalid format" in data["message"].lower()
+
+
+EXPORT_FORMAT_CASES = [
+    pytest.param("json", "application/json", _check_json_export, id="json"),
+    pytest.param("markdown", "text/markdown", _check_markdown_export, id="markdown"),
+    pytest.param("pdf", "application/pdf", _check_pdf_export, id="pdf"),
+    pytest.param("invalid_format", None, _check_invalid_format, id="invalid_format"),
+]
+
+
+class TestSummaryFixtures:
+    """Guard the unvalidated summary fixtures against schema drift."""
+
+    def test_constructed_sample_summary_should_match_validated(self, now_utc):
+        """Test model_construct() builds the same summary as validation."""
+        validated = build_sample_meeting_summary(now_utc, validate=True)
+        constructed = build_sample_meeting_summary(now_utc, validate=False)
+
+        assert validated.model_dump(exclude=_VOLATILE_FIELDS) == (
+            constructed.model_dump(exclude=_VOLATILE_FIELDS)
+        )
+
+
+@endpoint_not_implemented
 class TestSummaryRetrievalEndpoint:
     """Test summary retrieval endpoint functionality."""
 
     def test_should_retrieve_completed_summary_successfully(
-        self, client, sample_meeting_summary
+        self, client, serve_summary, sample_meeting_summary
     ):
         """Test successful summary retrieval."""
-        # with patch('src.services.summary_service.get_summary') as mock_get:
-        #     mock_get.return_value = sample_meeting_summary
-        #
-        #     response = client.get("/api/v1/summaries/summary_test_123")
-        #
-        #     assert response.status_code == 200
-        #     data = response.json()
-        #     assert data["success"] is True
-        #     assert data["data"]["meeting_id"] == "summary_test_123"
-        #     assert data["data"]["summary"] == sample_meeting_summary.summary
-        #     assert len(data["data"]["action_items"]) == 2
-        #     assert len(data["data"]["decisions"]) == 1
-        #     assert data["data"]["confidence_score"] == 0.89
-        pytest.skip("Endpoint not implemented yet")
+        # serve_summary(sample_meeting_summary)
+        # response = client.get("/api/v1/summaries/summary_test_123")
+
+        # assert response.status_code == 200
+        # data = response.json()
+        # assert data["success"] is True
+        # assert data["data"]["meeting_id"] == "summary_test_123"
+        # assert data["data"]["summary"] == sample_meeting_summary.summary
+        # assert len(data["data"]["action_items"]) == 2
+        # assert len(data["data"]["decisions"]) == 1
+        # assert data["data"]["confidence_score"] == 0.89
 
     def test_should_return_not_found_for_non_existent_summary(self, client):
         """Test retrieval of non-existent summary returns 404."""
@@ -86,66 +144,86 @@ class TestSummaryRetrievalEndpoint:
         # data = response.json()
         # assert data["success"] is False
         # assert "summary not found" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
-    def test_should_return_processing_status_for_incomplete_summary(self, client):
+    def test_should_return_processing_status_for_incomplete_summary(
+        self, client, monkeypatch
+    ):
         """Test retrieval during processing returns status."""
-        # with patch('src.services.summary_service.get_processing_status') as mock_status:
-        #     mock_status.return_value = {
-        #         "status": "processing",
-        #         "progress_percentage": 65,
-        #         "estimated_completion": datetime.now(timezone.utc).isoformat()
-        #     }
-        #
-        #     response = client.get("/api/v1/summaries/processing_789")
-        #
-        #     assert response.status_code == 202
-        #     data = response.json()
-        #     assert data["success"] is True
-        #     assert data["data"]["status"] == "processing"
-        #     assert data["data"]["progress_percentage"] == 65
-        pytest.skip("Endpoint not implemented yet")
-
-    def test_should_include_completion_percentage(self, client, sample_meeting_summary):
+        # from src.api.v1.endpoints.transcripts import (
+        #     meetings_storage,
+        #     processing_status_storage,
+        # )
+        # from src.models.transcript import ProcessingStatus, TranscriptStatus
+
+        # status = ProcessingStatus(
+        #     meeting_id="processing_789", status=TranscriptStatus.UPLOADED
+        # )
+        # status.mark_processing()
+        # status.progress_percentage = 65
+        # monkeypatch.setitem(
+        #     meetings_storage, "processing_789", {"meeting_id": "processing_789"}
+        # )
+        # monkeypatch.setitem(processing_status_storage, "processing_789", status)
+
+        # response = client.get("/api/v1/summaries/processing_789")
+
+        # assert response.status_code == 202
+        # data = response.json()
+        # assert data["success"] is True
+        # assert data["data"]["status"] == "processing"
+        # assert data["data"]["progress_percentage"] == 65
+
+    def test_should_include_completion_percentage(self, client, serve_summary):
         """Test summary includes action item completion percentage."""
-        # with patch('src.services.summary_service.get_summary') as mock_get:
-        #     mock_get.return_value = sample_meeting_summary
-        #
-        #     response = client.get("/api/v1/summaries/summary_test_123")
-        #
-        #     data = response.json()
-        #     assert "completion_percentage" in data["data"]
-        #     # 1 in_progress + 0 completed out of 2 total = 0% completed
-        #     assert data["data"]["completion_percentage"] == 0.0
-        pytest.skip("Endpoint not implemented yet")
+        # serve_summary(
+        #     make_meeting_summary(
+        #         action_items=[
+        #             make_action_item(status=ActionItemStatus.COMPLETED),
+        #             make_action_item(status=ActionItemStatus.IN_PROGRESS),
+        #         ]
+        #     )
+        # )
+
+        # response = client.get("/api/v1/summaries/summary_test_123")
 
-    def test_should_filter_by_status_when_requested(self, client):
+        # data = response.json()
+        # assert "completion_percentage" in data["data"]
+        # # 1 completed out of 2 total = 50% completed
+        # assert data["data"]["completion_percentage"] == 50.0
+
+    @pytest.mark.parametrize(
+        "status,expected_count",
+        [("pending", 1), ("completed", 0), ("in_progress", 1)],
+    )
+    def test_should_filter_by_status_when_requested(
+        self, client, serve_summary, sample_meeting_summary, status, expected_count
+    ):
         """Test filtering action items by status."""
-        # response = client.get("/api/v1/summaries/summary_test_123?action_status=pending")
+        # serve_summary(sample_meeting_summary)
+        # response = client.get(
+        #     f"/api/v1/summaries/summary_test_123?action_status={status}"
+        # )
 
         # assert response.status_code == 200
         # data = response.json()
         # action_items = data["data"]["action_items"]
-        # assert all(item["status"] == "pending" for item in action_items)
-        pytest.skip("Endpoint not implemented yet")
+        # assert len(action_items) == expected_count
+        # assert all(item["status"] == status for item in action_items)
 
     def test_should_include_metadata_when_available(
-        self, client, sample_meeting_summary
+        self, client, serve_summary, sample_meeting_summary
     ):
         """Test summary includes meeting metadata."""
-        # with patch('src.services.summary_service.get_summary') as mock_get:
-        #     summary_with_metadata = sample_meeting_summary
-        #     mock_get.return_value = summary_with_metadata
-        #
-        #     response = client.get("/api/v1/summaries/summary_test_123")
-        #
-        #     data = response.json()
-        #     assert "created_at" in data["data"]
-        #     assert "processing_time_seconds" in data["data"]
-        #     assert data["data"]["processing_time_seconds"] == 15.3
-        pytest.skip("Endpoint not implemented yet")
+        # serve_summary(sample_meeting_summary)
+        # response = client.get("/api/v1/summaries/summary_test_123")
 
+        # data = response.json()
+        # assert "created_at" in data["data"]
+        # assert "processing_time_seconds" in data["data"]
+        # assert data["data"]["processing_time_seconds"] == 15.3
 
+
+@endpoint_not_implemented
 class TestSummaryListEndpoint:
     """Test summary listing endpoint functionality."""
 
@@ -161,7 +239,6 @@ class TestSummaryListEndpoint:
         # assert "page" in data["data"]
         # assert "size" in data["data"]
         # assert "pages" in data["data"]
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_filter_by_date_range(self, client):
         """Test filtering summaries by date range."""
@@ -175,7 +252,6 @@ class TestSummaryListEndpoint:
         # for summary in data["data"]["items"]:
         #     created_date = datetime.fromisoformat(summary["created_at"])
         #     assert start_date <= created_date.date().isoformat() <= end_date
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_sort_by_creation_date_desc_by_default(self, client):
         """Test default sorting by creation date descending."""
@@ -190,76 +266,35 @@ class TestSummaryListEndpoint:
         #     current_date = datetime.fromisoformat(items[i]["created_at"])
         #     next_date = datetime.fromisoformat(items[i + 1]["created_at"])
         #     assert current_date >= next_date
-        pytest.skip("Endpoint not implemented yet")
 
 
+@endpoint_not_implemented
 class TestSummaryExportEndpoint:
     """Test summary export endpoint functionality."""
 
-    def test_should_export_summary_as_json(self, client, sample_meeting_summary):
-        """Test exporting summary in JSON format."""
-        # with patch('src.services.summary_service.get_summary') as mock_get:
-        #     mock_get.return_value = sample_meeting_summary
-        #
-        #     response = client.post("/api/v1/summaries/export", json={
-        #         "meeting_id": "summary_test_123",
-        #         "format": "json"
-        #     })
-        #
-        #     assert response.status_code == 200
-        #     assert response.headers["content-type"] == "application/json"
-        #     data = response.json()
-        #     assert data["meeting_id"] == "summary_test_123"
-        #     assert "action_items" in data
-        #     assert "decisions" in data
-        pytest.skip("Endpoint not implemented yet")
-
-    def test_should_export_summary_as_markdown(self, client, sample_meeting_summary):
-        """Test exporting summary in Markdown format."""
-        # with patch('src.services.summary_service.get_summary') as mock_get:
-        #     mock_get.return_value = sample_meeting_summary
-        #
-        #     response = client.post("/api/v1/summaries/export", json={
-        #         "meeting_id": "summary_test_123",
-        #         "format": "markdown"
-        #     })
-        #
-        #     assert response.status_code == 200
-        #     assert response.headers["content-type"] == "text/markdown"
-        #     content = response.content.decode()
-        #     assert "# Meeting Summary" in content
-        #     assert "## Action Items" in content
-        #     assert "## Decisions Made" in content
-        pytest.skip("Endpoint not implemented yet")
-
-    def test_should_export_summary_as_pdf(self, client, sample_meeting_summary):
-        """Test exporting summary in PDF format."""
-        # with patch('src.services.summary_service.get_summary') as mock_get:
-        #     mock_get.return_value = sample_meeting_summary
-        #
-        #     response = client.post("/api/v1/summaries/export", json={
-        #         "meeting_id": "summary_test_123",
-        #         "format": "pdf"
-        #     })
-        #
-        #     assert response.status_code == 200
-        #     assert response.headers["content-type"] == "application/pdf"
-        #     assert response.headers["content-disposition"].startswith("attachment")
-        #     assert len(response.content) > 0
-        pytest.skip("Endpoint not implemented yet")
-
-    def test_should_validate_export_format(self, client):
-        """Test validation of export format."""
+    @pytest.mark.parametrize(
+        "export_format,content_type,check_body", EXPORT_FORMAT_CASES
+    )
+    def test_should_export_summary(
+        self,
+        client,
+        serve_summary,
+        sample_meeting_summary,
+        export_format,
+        content_type,
+        check_body,
+    ):
+        """Test exporting summary in each supported format."""
+        # serve_summary(sample_meeting_summary)
         # response = client.post("/api/v1/summaries/export", json={
         #     "meeting_id": "summary_test_123",
-        #     "format": "invalid_format"
+        #     "format": export_format
         # })
-
-        # assert response.status_code == 422
-        # data = response.json()
-        # assert data["success"] is False
-        # assert "invalid format" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
+        #
+        # if content_type is not None:
+        #     assert response.status_code == 200
+        #     assert response.headers["content-type"] == content_type
+        # check_body(response)
 
     def test_should_include_custom_template_options(self, client):
         """Test export with custom template options."""
@@ -277,36 +312,33 @@ class TestSummaryExportEndpoint:
         # content = response.content.decode()
         # # Verify template options were applied
         # assert "**Time:**" in content  # Timestamps included
-        pytest.skip("Endpoint not implemented yet")
 
-    def test_should_handle_large_summaries_with_streaming(self, client):
+    def test_should_handle_large_summaries_with_streaming(self, client, serve_summary):
         """Test streaming response for large summary exports."""
-        # # Create a large summary with many action items
-        # large_summary = MeetingSummary(
-        #     meeting_id="large_summary_123",
-        #     summary="Large meeting with many items",
-        #     key_topics=[f"Topic {i}" for i in range(20)],
-        #     participants=["Alice", "Bob"],
-        #     action_items=[
-        #         ActionItem(task=f"Task {i}", assignee="Alice", status=ActionItemStatus.PENDING)
-        #         for i in range(100)
-        #     ],
-        #     decisions=[],
-        #     confidence_score=0.8,
-        #     processing_time_seconds=30.0
+        # # Serve a large summary with many action items
+        # serve_summary(
+        #     make_meeting_summary(
+        #         meeting_id="large_summary_123",
+        #         summary="Large meeting with many items",
+        #         key_topics=[f"Topic {i}" for i in range(20)],
+        #         participants=["Alice", "Bob"],
+        #         action_items=[
+        #             make_action_item(task=f"Task {i}", assignee="Alice")
+        #             for i in range(100)
+        #         ],
+        #         decisions=[],
+        #         confidence_score=0.8,
+        #         processing_time_seconds=30.0,
+        #     )
         # )
 
-        # with patch('src.services.summary_service.get_summary') as mock_get:
-        #     mock_get.return_value = large_summary
-        #
-        #     response = client.post("/api/v1/summaries/export", json={
-        #         "meeting_id": "large_summary_123",
-        #         "format": "markdown"
-        #     })
-        #
-        #     assert response.status_code == 200
-        #     assert "transfer-encoding" in response.headers or len(response.content) > 1000
-        pytest.skip("Endpoint not implemented yet")
+        # response = client.post("/api/v1/summaries/export", json={
+        #     "meeting_id": "large_summary_123",
+        #     "format": "markdown"
+        # })
+
+        # assert response.status_code == 200
+        # assert "transfer-encoding" in response.headers or len(response.content) > 1000
 
     def test_should_return_not_found_for_non_existent_summary_export(self, client):
         """Test export of non-existent summary returns 404."""
@@ -319,9 +351,9 @@ class TestSummaryExportEndpoint:
         # data = response.json()
         # assert data["success"] is False
         # assert "summary not found" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
 
+@endpoint_not_implemented
 class TestBulkExportEndpoint:
     """Test bulk summary export functionality."""
 
@@ -336,7 +368,6 @@ class TestBulkExportEndpoint:
         # assert response.headers["content-type"] == "application/zip"
         # assert response.headers["content-disposition"].startswith("attachment")
         # assert "bulk_export" in response.headers["content-disposition"]
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_validate_bulk_export_limits(self, client):
         """Test validation of bulk export limits."""
@@ -352,4 +383,3 @@ class TestBulkExportEndpoint:
         # data = response.json()
         # assert data["success"] is False
         # assert "too many" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
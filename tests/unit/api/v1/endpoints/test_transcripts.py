@@ -1,19 +1,37 @@
 """Comprehensive tests for transcript endpoints."""
 
-from io import BytesIO
+import tempfile
 
 import pytest
 
-# Import will be available after implementation
-# from src.main import app
+# Remove once the endpoints are implemented
+pytestmark = pytest.mark.skip(reason="Endpoint not implemented yet")
 
 
-@pytest.fixture
-def client():
-    """Test client fixture."""
-    # Will be implemented after main app is ready
-    # return TestClient(app)
-    pass
+@pytest.fixture(scope="session")
+def transcript_store():
+    """Fixture providing the endpoint's in-memory transcript stores.
+
+    The stores are module-level dicts, so each pytest-xdist worker process
+    already owns a private copy; tests only need to clear it between runs.
+    Imported here so collecting this skipped module does not load the routers.
+    """
+    from src.api.v1.endpoints.transcripts import (
+        meetings_storage,
+        processing_status_storage,
+    )
+
+    return meetings_storage, processing_status_storage
+
+
+@pytest.fixture(autouse=True)
+def reset_transcript_store(transcript_store):
+    """Fixture isolating the in-memory transcript store for every test."""
+    for store in transcript_store:
+        store.clear()
+    yield
+    for store in transcript_store:
+        store.clear()
 
 
 @pytest.fixture
@@ -29,11 +47,29 @@ def valid_transcript_data():
     }
 
 
-@pytest.fixture
-def audio_file():
-    """Fixture providing mock audio file."""
-    audio_content = b"fake_audio_content_for_testing"
-    return BytesIO(audio_content)
+@pytest.fixture(scope="session")
+def audio_bytes():
+    """Fixture providing raw mock audio content, built once per session.
+
+    httpx streams bytes payloads as-is, so tests upload these directly
+    rather than wrapping them in a file object.
+    """
+    return b"fake_audio_content_for_testing"
+
+
+@pytest.fixture(scope="module")
+def oversized_audio_file():
+    """Fixture providing a file just over the upload limit without holding it in memory.
+
+    Truncating past max_size rolls the spooled file over to disk, where the
+    extension is sparse, so the kernel zero-fills lazily instead of
+    allocating the payload up front.
+    """
+    from src.api.v1.endpoints.transcripts import MAX_FILE_SIZE
+
+    with tempfile.SpooledTemporaryFile(max_size=1024) as large_audio:
+        large_audio.truncate(MAX_FILE_SIZE + 1024 * 1024)  # 1MB over the limit
+        yield large_audio
 
 
 class TestTranscriptUploadEndpoint:
@@ -51,11 +87,10 @@ class TestTranscriptUploadEndpoint:
         # assert data["message"] == "Transcript uploaded successfully"
         # assert data["data"]["meeting_id"] == valid_transcript_data["meeting_id"]
         # assert data["data"]["status"] == "uploaded"
-        pytest.skip("Endpoint not implemented yet")
 
-    def test_should_upload_audio_file_successfully(self, client, audio_file):
+    def test_should_upload_audio_file_successfully(self, client, audio_bytes):
         """Test successful audio file upload."""
-        # files = {"audio_file": ("meeting.mp3", audio_file, "audio/mpeg")}
+        # files = {"audio_file": ("meeting.mp3", audio_bytes, "audio/mpeg")}
         # data = {
         #     "meeting_id": "audio_meeting_123",
         #     "participants": ["John", "Alice"],
@@ -69,7 +104,6 @@ class TestTranscriptUploadEndpoint:
         # response_data = response.json()
         # assert response_data["success"] is True
         # assert response_data["data"]["status"] == "uploaded"
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_validate_required_fields(self, client):
         """Test validation of required fields."""
@@ -82,7 +116,6 @@ class TestTranscriptUploadEndpoint:
         # assert data["success"] is False
         # assert "participants" in str(data["errors"])
         # assert "duration_minutes" in str(data["errors"])
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_reject_duplicate_meeting_id(self, client, valid_transcript_data):
         """Test rejection of duplicate meeting IDs."""
@@ -97,13 +130,13 @@ class TestTranscriptUploadEndpoint:
         # data = response2.json()
         # assert data["success"] is False
         # assert "already exists" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
-    def test_should_validate_file_size_limits(self, client):
+    def test_should_validate_file_size_limits(self, client, oversized_audio_file):
         """Test file size validation."""
-        # # Create oversized file (>100MB)
-        # large_audio = BytesIO(b"x" * (101 * 1024 * 1024))  # 101MB
-        # files = {"audio_file": ("large_meeting.mp3", large_audio, "audio/mpeg")}
+        # oversized_audio_file.seek(0)
+        # files = {
+        #     "audio_file": ("large_meeting.mp3", oversized_audio_file, "audio/mpeg")
+        # }
         # data = {
         #     "meeting_id": "large_meeting_123",
         #     "participants": ["John"],
@@ -117,12 +150,10 @@ class TestTranscriptUploadEndpoint:
         # data = response.json()
         # assert data["success"] is False
         # assert "file too large" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_validate_audio_file_format(self, client):
         """Test audio file format validation."""
-        # invalid_file = BytesIO(b"not_an_audio_file")
-        # files = {"audio_file": ("meeting.txt", invalid_file, "text/plain")}
+        # files = {"audio_file": ("meeting.txt", b"not_an_audio_file", "text/plain")}
         # data = {
         #     "meeting_id": "invalid_format_123",
         #     "participants": ["John"],
@@ -136,7 +167,6 @@ class TestTranscriptUploadEndpoint:
         # data = response.json()
         # assert data["success"] is False
         # assert "invalid audio format" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_require_either_text_or_audio(self, client):
         """Test that either raw_text or audio file is required."""
@@ -153,7 +183,6 @@ class TestTranscriptUploadEndpoint:
         # response_data = response.json()
         # assert response_data["success"] is False
         # assert "either raw_text or audio_url must be provided" in response_data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_sanitize_participant_names(self, client):
         """Test participant name sanitization."""
@@ -172,7 +201,6 @@ class TestTranscriptUploadEndpoint:
         # # Should be cleaned and deduplicated
         # expected_participants = ["John Smith", "ALICE JOHNSON"]
         # assert data["data"]["participants"] == expected_participants
-        pytest.skip("Endpoint not implemented yet")
 
 
 class TestTranscriptProcessingEndpoint:
@@ -201,7 +229,6 @@ class TestTranscriptProcessingEndpoint:
         # assert data["message"] == "Processing started"
         # assert data["data"]["status"] == "processing"
         # assert "estimated_completion" in data["data"]
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_return_error_for_non_existent_meeting(self, client):
         """Test processing non-existent meeting returns error."""
@@ -212,7 +239,6 @@ class TestTranscriptProcessingEndpoint:
         # data = response.json()
         # assert data["success"] is False
         # assert "meeting not found" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_prevent_duplicate_processing(self, client):
         """Test prevention of duplicate processing requests."""
@@ -239,7 +265,6 @@ class TestTranscriptProcessingEndpoint:
         # data = response2.json()
         # assert data["success"] is False
         # assert "already processing" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_include_processing_options(self, client):
         """Test processing with custom options."""
@@ -266,7 +291,6 @@ class TestTranscriptProcessingEndpoint:
         # assert response.status_code == 202
         # data = response.json()
         # assert data["data"]["processing_options"] == process_data["options"]
-        pytest.skip("Endpoint not implemented yet")
 
 
 class TestTranscriptStatusEndpoint:
@@ -281,7 +305,6 @@ class TestTranscriptStatusEndpoint:
         # assert data["success"] is True
         # assert "status" in data["data"]
         # assert "progress_percentage" in data["data"]
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_return_not_found_for_non_existent_meeting(self, client):
         """Test status check for non-existent meeting."""
@@ -291,7 +314,6 @@ class TestTranscriptStatusEndpoint:
         # data = response.json()
         # assert data["success"] is False
         # assert "meeting not found" in data["message"].lower()
-        pytest.skip("Endpoint not implemented yet")
 
     def test_should_include_error_details_when_failed(self, client):
         """Test status includes error details for failed processing."""
@@ -303,4 +325,3 @@ class TestTranscriptStatusEndpoint:
         # assert data["data"]["status"] == "failed"
         # assert "error_message" in data["data"]
         # assert data["data"]["error_message"] is not None
-        pytest.skip("Endpoint not implemented yet")
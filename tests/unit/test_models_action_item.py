@@ -1,6 +1,9 @@
 """Comprehensive tests for ActionItem model."""
 
+from contextlib import nullcontext
 from datetime import UTC, datetime, timedelta
+from functools import partial
+from types import MappingProxyType
 
 import pytest
 from pydantic import ValidationError
@@ -11,30 +14,79 @@ from src.models.action_item import (
     ActionItemStatus,
     ActionItemUpdate,
 )
+from tests.utils import factories
 from tests.utils.model_helpers import create_action_item_with_past_date
 
+VALID_ACTION_ITEM_DATA = MappingProxyType(
+    {
+        "task": "Complete quarterly budget analysis",
+        "assignee": "Alice Johnson",
+        "priority": ActionItemPriority.HIGH,
+        "context": "Needed for Q1 planning meeting next week",
+    }
+)
+
+TAG_CASES = [
+    pytest.param(
+        ["  Budget  ", "QUARTERLY", "budget", "analysis", "x"],
+        ["budget", "quarterly", "analysis"],
+        id="strip_case_dedup_min_length",
+    ),
+    pytest.param(["  budget  "], ["budget"], id="whitespace"),
+    pytest.param(["Budget", "BUDGET"], ["budget"], id="case"),
+    pytest.param(["x", "ab"], ["ab"], id="min_length"),
+    pytest.param(["", " "], [], id="all_empty"),
+    pytest.param(["abc"] * 10, ["abc"], id="heavy_dedup"),
+]
+
+
+def assert_transitions(item, action, expected_status, frozen_now):
+    """Run a mark_*() action and check the new status and update timestamp."""
+    action()
+    assert item.status == expected_status
+    assert item.updated_at == frozen_now
+
 
 class TestActionItem:
     """Test ActionItem model functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_action_item_data(self):
-        """Fixture providing valid action item data."""
-        return {
-            "task": "Complete quarterly budget analysis",
-            "assignee": "Alice Johnson",
-            "priority": ActionItemPriority.HIGH,
-            "context": "Needed for Q1 planning meeting next week",
-        }
+        """Fixture providing valid action item data.
+
+        A read-only mapping; tests override fields through
+        ``make_action_item(...)`` instead of mutating it.
+        """
+        return VALID_ACTION_ITEM_DATA
+
+    @pytest.fixture(scope="class")
+    def make_action_item(self, valid_action_item_data):
+        """Fixture binding the valid data onto ``factories.make_action_item``.
+
+        Call-time keywords override the bound data, and ``validate=False``
+        works as it does on the shared factory.
+        """
+        return partial(factories.make_action_item, **valid_action_item_data)
+
+    @pytest.fixture(scope="class")
+    def baseline_action_item(self, valid_action_item_data):
+        """Fixture providing one unmodified ActionItem for read-only tests.
+
+        Shared across the class, so tests that call mark_*() or otherwise
+        mutate an item must build their own with make_action_item.
+        """
+        return ActionItem(**valid_action_item_data)
 
     @pytest.fixture
-    def future_date(self):
+    def future_date(self, frozen_now):
         """Fixture providing a future date."""
-        return datetime.now(UTC) + timedelta(days=7)
+        return frozen_now + timedelta(days=7)
 
-    def test_should_create_action_item_with_valid_data(self, valid_action_item_data):
+    def test_should_create_action_item_with_valid_data(
+        self, valid_action_item_data, baseline_action_item
+    ):
         """Test creating ActionItem with valid data."""
-        action_item = ActionItem(**valid_action_item_data)
+        action_item = baseline_action_item
 
         assert action_item.task == valid_action_item_data["task"]
         assert action_item.assignee == valid_action_item_data["assignee"]
@@ -46,208 +98,251 @@ class TestActionItem:
         assert action_item.completed_at is None
         assert action_item.completion_notes == ""
 
-    def test_should_generate_unique_id(self, valid_action_item_data):
+    def test_should_generate_unique_id(self, make_action_item):
         """Test that each ActionItem gets a unique ID."""
-        item1 = ActionItem(**valid_action_item_data)
-        item2 = ActionItem(**valid_action_item_data)
+        item1 = make_action_item()
+        item2 = make_action_item()
 
         assert item1.id != item2.id
         assert str(item1.id)  # Should be valid UUID string
 
-    def test_should_inherit_timestamp_functionality(self, valid_action_item_data):
+    def test_should_inherit_timestamp_functionality(self, make_action_item, frozen_now):
         """Test that ActionItem inherits timestamp behavior."""
-        before = datetime.now(UTC)
-        action_item = ActionItem(**valid_action_item_data)
-        after = datetime.now(UTC)
+        action_item = make_action_item()
 
-        assert before <= action_item.created_at <= after
+        assert action_item.created_at == frozen_now
         assert action_item.updated_at is None
 
-    def test_should_validate_task_length(self, valid_action_item_data):
+    @pytest.mark.parametrize(
+        "task,error_pattern",
+        [
+            ("hi", "at least 5 characters"),
+            ("x" * 501, "at most 500 characters"),
+            ("Complete the analysis report", None),
+        ],
+        ids=["too_short", "too_long", "valid"],
+    )
+    def test_should_validate_task_length(self, make_action_item, task, error_pattern):
         """Test task length validation."""
-        # Too short
-        with pytest.raises(ValueError, match="at least 5 characters"):
-            ActionItem(**{**valid_action_item_data, "task": "hi"})
-
-        # Too long
-        long_task = "x" * 501
-        with pytest.raises(ValueError, match="at most 500 characters"):
-            ActionItem(**{**valid_action_item_data, "task": long_task})
-
-        # Valid length
-        valid_task = "Complete the analysis report"
-        action_item = ActionItem(**{**valid_action_item_data, "task": valid_task})
-        assert action_item.task == valid_task
-
-    def test_should_validate_assignee_format(self, valid_action_item_data):
+        expectation = (
+            pytest.raises(ValueError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            action_item = make_action_item(task=task)
+            assert action_item.task == task
+
+    @pytest.mark.parametrize(
+        "assignee,error_pattern",
+        [
+            ("", "String should have at least 1 character"),
+            ("Alice@Johnson", "invalid characters"),
+            ("Alice Johnson", None),
+            ("Bob O'Connor", None),
+            ("Mary-Jane Smith", None),
+            ("Dr. Sarah Chen", None),
+        ],
+        ids=[
+            "empty",
+            "invalid_characters",
+            "plain",
+            "apostrophe",
+            "hyphen",
+            "title",
+        ],
+    )
+    def test_should_validate_assignee_format(
+        self, make_action_item, assignee, error_pattern
+    ):
         """Test assignee name validation."""
-        # Empty assignee
-        with pytest.raises(
-            ValidationError, match="String should have at least 1 character"
-        ):
-            ActionItem(**{**valid_action_item_data, "assignee": ""})
-
-        # Invalid characters
-        with pytest.raises(ValueError, match="invalid characters"):
-            ActionItem(**{**valid_action_item_data, "assignee": "Alice@Johnson"})
-
-        # Valid names
-        valid_names = [
-            "Alice Johnson",
-            "Bob O'Connor",
-            "Mary-Jane Smith",
-            "Dr. Sarah Chen",
-        ]
-
-        for name in valid_names:
-            action_item = ActionItem(**{**valid_action_item_data, "assignee": name})
-            assert action_item.assignee == name
-
-    def test_should_validate_due_date_not_in_past(self, valid_action_item_data):
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            action_item = make_action_item(assignee=assignee)
+            assert action_item.assignee == assignee
+
+    def test_should_validate_due_date_not_in_past(self, make_action_item, frozen_now):
         """Test that due date cannot be in the past."""
-        past_date = datetime.now(UTC) - timedelta(days=1)
+        past_date = frozen_now - timedelta(days=1)
 
         with pytest.raises(ValueError, match="Due date cannot be in the past"):
-            ActionItem(**{**valid_action_item_data, "due_date": past_date})
+            make_action_item(due_date=past_date)
 
-    def test_should_accept_future_due_date(self, valid_action_item_data, future_date):
+    def test_should_accept_future_due_date(self, make_action_item, future_date):
         """Test that future due dates are accepted."""
-        action_item = ActionItem(**{**valid_action_item_data, "due_date": future_date})
+        action_item = make_action_item(due_date=future_date)
         assert action_item.due_date == future_date
 
-    def test_should_validate_and_clean_tags(self, valid_action_item_data):
+    @pytest.mark.parametrize("tags,expected_tags", TAG_CASES)
+    def test_should_validate_and_clean_tags(
+        self, make_action_item, tags, expected_tags
+    ):
         """Test tag validation and cleaning."""
-        tags = ["  Budget  ", "QUARTERLY", "budget", "analysis", "x"]
-        action_item = ActionItem(**{**valid_action_item_data, "tags": tags})
+        action_item = make_action_item(tags=tags)
 
         # Should be cleaned: lowercased, stripped, deduplicated, min length
-        expected_tags = ["budget", "quarterly", "analysis"]
         assert action_item.tags == expected_tags
 
-    def test_should_validate_estimated_hours(self, valid_action_item_data):
+    @pytest.mark.parametrize(
+        "estimated_hours,error_pattern",
+        [
+            (0.05, "greater than or equal to 0.1"),
+            (201, "less than or equal to 200"),
+            (4.5, None),
+        ],
+        ids=["too_small", "too_large", "valid"],
+    )
+    def test_should_validate_estimated_hours(
+        self, make_action_item, estimated_hours, error_pattern
+    ):
         """Test estimated hours validation."""
-        # Too small
-        with pytest.raises(ValueError, match="greater than or equal to 0.1"):
-            ActionItem(**{**valid_action_item_data, "estimated_hours": 0.05})
-
-        # Too large
-        with pytest.raises(ValueError, match="less than or equal to 200"):
-            ActionItem(**{**valid_action_item_data, "estimated_hours": 201})
-
-        # Valid hours
-        action_item = ActionItem(**{**valid_action_item_data, "estimated_hours": 4.5})
-        assert action_item.estimated_hours == 4.5
+        expectation = (
+            pytest.raises(ValueError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            action_item = make_action_item(estimated_hours=estimated_hours)
+            assert action_item.estimated_hours == estimated_hours
 
-    def test_should_mark_completed_correctly(self, valid_action_item_data):
+    def test_should_mark_completed_correctly(self, make_action_item, frozen_now):
         """Test marking action item as completed."""
-        action_item = ActionItem(**valid_action_item_data)
+        action_item = make_action_item()
         notes = "Finished ahead of schedule"
 
-        before = datetime.now(UTC)
-        action_item.mark_completed(notes)
-        after = datetime.now(UTC)
-
-        assert action_item.status == ActionItemStatus.COMPLETED
-        assert before <= action_item.completed_at <= after
+        assert_transitions(
+            action_item,
+            lambda: action_item.mark_completed(notes),
+            ActionItemStatus.COMPLETED,
+            frozen_now,
+        )
+        assert action_item.completed_at == frozen_now
         assert action_item.completion_notes == notes
-        assert action_item.updated_at is not None
 
-    def test_should_mark_in_progress_correctly(self, valid_action_item_data):
+    def test_should_mark_in_progress_correctly(self, make_action_item, frozen_now):
         """Test marking action item as in progress."""
-        action_item = ActionItem(**valid_action_item_data)
-
-        action_item.mark_in_progress()
-
-        assert action_item.status == ActionItemStatus.IN_PROGRESS
-        assert action_item.updated_at is not None
-
-    def test_should_mark_blocked_correctly(self, valid_action_item_data):
-        """Test marking action item as blocked."""
-        action_item = ActionItem(**valid_action_item_data)
+        action_item = make_action_item()
 
-        action_item.mark_blocked()
-
-        assert action_item.status == ActionItemStatus.BLOCKED
-        assert action_item.updated_at is not None
-
-    def test_should_detect_overdue_items(self, valid_action_item_data):
-        """Test overdue detection."""
-        past_due = datetime.now(UTC) - timedelta(hours=1)
-        future_due = datetime.now(UTC) + timedelta(days=1)
-
-        # Overdue item - use test utility to create with past due date
-        overdue_item = create_action_item_with_past_date(
-            valid_action_item_data, past_due
+        assert_transitions(
+            action_item,
+            action_item.mark_in_progress,
+            ActionItemStatus.IN_PROGRESS,
+            frozen_now,
         )
-        assert overdue_item.is_overdue() is True
-
-        # Not overdue
-        future_item = ActionItem(**{**valid_action_item_data, "due_date": future_due})
-        assert future_item.is_overdue() is False
 
-        # No due date
-        no_date_item = ActionItem(**valid_action_item_data)
-        assert no_date_item.is_overdue() is False
+    def test_should_mark_blocked_correctly(self, make_action_item, frozen_now):
+        """Test marking action item as blocked."""
+        action_item = make_action_item()
 
-        # Completed item (not overdue even if past due date)
-        completed_item = create_action_item_with_past_date(
-            valid_action_item_data, past_due
+        assert_transitions(
+            action_item, action_item.mark_blocked, ActionItemStatus.BLOCKED, frozen_now
         )
-        completed_item.mark_completed()
-        assert completed_item.is_overdue() is False
 
-    def test_should_calculate_days_until_due(self, valid_action_item_data):
+    @pytest.mark.parametrize(
+        "offset_hours,completed,expected",
+        [
+            (-1, False, True),
+            (24, False, False),
+            (None, False, False),
+            (-1, True, False),
+        ],
+        ids=["past_open", "future_open", "no_date", "past_done"],
+    )
+    def test_should_detect_overdue_items(
+        self,
+        valid_action_item_data,
+        make_action_item,
+        frozen_now,
+        offset_hours,
+        completed,
+        expected,
+    ):
+        """Test overdue detection."""
+        if offset_hours is None:
+            action_item = make_action_item()
+        elif offset_hours < 0:
+            # Past due dates fail validation, so bypass it for this case
+            action_item = create_action_item_with_past_date(
+                valid_action_item_data, frozen_now + timedelta(hours=offset_hours)
+            )
+        else:
+            action_item = make_action_item(
+                due_date=frozen_now + timedelta(hours=offset_hours)
+            )
+
+        if completed:
+            action_item.mark_completed()
+
+        assert action_item.is_overdue() is expected
+
+    def test_should_calculate_days_until_due(
+        self, valid_action_item_data, make_action_item, baseline_action_item, frozen_now
+    ):
         """Test days until due date calculation."""
         # Future date
-        future_date = datetime.now(UTC) + timedelta(days=5)
-        future_item = ActionItem(**{**valid_action_item_data, "due_date": future_date})
-        # Allow for 4 or 5 days due to timezone/precision differences
-        assert future_item.days_until_due() in [4, 5]
+        future_date = frozen_now + timedelta(days=5)
+        future_item = make_action_item(due_date=future_date)
+        assert future_item.days_until_due() == 5
 
         # Past date (negative days)
-        past_date = datetime.now(UTC) - timedelta(days=2)
+        past_date = frozen_now - timedelta(days=2)
         past_item = create_action_item_with_past_date(valid_action_item_data, past_date)
-        # Allow for -2 or -3 days due to timezone/precision differences
-        assert past_item.days_until_due() in [-3, -2]
+        assert past_item.days_until_due() == -2
 
         # No due date
-        no_date_item = ActionItem(**valid_action_item_data)
-        assert no_date_item.days_until_due() is None
+        assert baseline_action_item.days_until_due() is None
 
-    def test_should_serialize_correctly(self, valid_action_item_data, future_date):
+    def test_should_serialize_correctly(
+        self, valid_action_item_data, make_action_item, future_date
+    ):
         """Test ActionItem serialization."""
-        action_item = ActionItem(
-            **{
-                **valid_action_item_data,
-                "due_date": future_date,
-                "tags": ["budget", "quarterly"],
-                "estimated_hours": 5.5,
-            }
+        action_item = make_action_item(
+            due_date=future_date, tags=["budget", "quarterly"], estimated_hours=5.5
         )
 
-        data = action_item.model_dump()
+        data = action_item.model_dump(
+            include={
+                "id",
+                "created_at",
+                "task",
+                "assignee",
+                "priority",
+                "status",
+                "tags",
+                "estimated_hours",
+            }
+        )
 
-        # Check key fields are present
-        assert data["task"] == valid_action_item_data["task"]
-        assert data["assignee"] == valid_action_item_data["assignee"]
-        assert data["priority"] == "high"  # Enum value
-        assert data["status"] == "pending"  # Enum value
-        assert data["tags"] == ["budget", "quarterly"]
-        assert data["estimated_hours"] == 5.5
-        assert "id" in data
-        assert "created_at" in data
+        assert data == {
+            "id": action_item.id,
+            "created_at": action_item.created_at,
+            "task": valid_action_item_data["task"],
+            "assignee": valid_action_item_data["assignee"],
+            "priority": "high",  # Enum value
+            "status": "pending",  # Enum value
+            "tags": ["budget", "quarterly"],
+            "estimated_hours": 5.5,
+        }
 
-    def test_should_handle_all_enum_values(self, valid_action_item_data):
-        """Test that all enum values work correctly."""
-        # Test all status values
-        for status in ActionItemStatus:
-            action_item = ActionItem(**{**valid_action_item_data, "status": status})
-            assert action_item.status == status
+    @pytest.mark.parametrize(
+        "status", list(ActionItemStatus), ids=[s.name for s in ActionItemStatus]
+    )
+    def test_should_accept_each_status(self, make_action_item, status):
+        """Test that every status value works correctly."""
+        action_item = make_action_item(status=status)
+        assert action_item.status == status
 
-        # Test all priority values
-        for priority in ActionItemPriority:
-            action_item = ActionItem(**{**valid_action_item_data, "priority": priority})
-            assert action_item.priority == priority
+    @pytest.mark.parametrize(
+        "priority", list(ActionItemPriority), ids=[p.name for p in ActionItemPriority]
+    )
+    def test_should_accept_each_priority(self, make_action_item, priority):
+        """Test that every priority value works correctly."""
+        action_item = make_action_item(priority=priority)
+        assert action_item.priority == priority
 
 
 class TestActionItemUpdate:
@@ -264,21 +359,19 @@ class TestActionItemUpdate:
         assert update.assignee is None  # Not provided
         assert update.due_date is None  # Not provided
 
-    def test_should_validate_updated_fields(self):
+    @pytest.mark.parametrize(
+        "field,value,error_pattern",
+        [
+            ("task", "hi", "at least 5 characters"),
+            ("assignee", "", "String should have at least 1 character"),
+            ("estimated_hours", 0.05, "greater than or equal to 0.1"),
+        ],
+        ids=["task_too_short", "assignee_empty", "estimated_hours_too_small"],
+    )
+    def test_should_validate_updated_fields(self, field, value, error_pattern):
         """Test that updated fields are validated."""
-        # Invalid task length
-        with pytest.raises(ValueError, match="at least 5 characters"):
-            ActionItemUpdate(task="hi")
-
-        # Invalid assignee
-        with pytest.raises(
-            ValidationError, match="String should have at least 1 character"
-        ):
-            ActionItemUpdate(assignee="")
-
-        # Invalid estimated hours
-        with pytest.raises(ValueError, match="greater than or equal to 0.1"):
-            ActionItemUpdate(estimated_hours=0.05)
+        with pytest.raises(ValidationError, match=error_pattern):
+            ActionItemUpdate(**{field: value})
 
     def test_should_allow_all_none_values(self):
         """Test that update can have all None values."""
@@ -301,9 +394,11 @@ class TestActionItemUpdate:
             tags=["updated", "test"],
         )
 
-        data = update.model_dump()
+        data = update.model_dump(include={"task", "priority", "assignee", "tags"})
 
-        assert data["task"] == "New task"
-        assert data["priority"] == "high"
-        assert data["assignee"] is None
-        assert data["tags"] == ["updated", "test"]
+        assert data == {
+            "task": "New task",
+            "priority": "high",
+            "assignee": None,
+            "tags": ["updated", "test"],
+        }
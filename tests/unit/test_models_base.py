@@ -1,6 +1,8 @@
 """Comprehensive tests for base models."""
 
-from datetime import UTC, datetime
+from contextlib import nullcontext
+from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
 
 import pytest
 from pydantic import ValidationError
@@ -12,72 +14,87 @@ from src.models.base import (
     TimestampedModel,
 )
 
+PAGE_ITEMS = tuple(range(10))
+
+VALID_PAGINATION = MappingProxyType(
+    {"items": [], "total": 10, "page": 1, "size": 10, "pages": 1}
+)
+
+EXPECTED_API_SUCCESS_DUMP = MappingProxyType(
+    {
+        "success": True,
+        "message": "Success",
+        "data": {"test": "value"},
+        "errors": None,
+    }
+)
+
+EXPECTED_PAGINATED_DUMP = MappingProxyType(
+    {"items": ["item1", "item2"], "total": 25, "page": 2, "size": 5, "pages": 5}
+)
+
+
+class _NameValueModel(BaseModelWithConfig):
+    name: str
+    value: int
+
+
+class _NameOnlyModel(BaseModelWithConfig):
+    name: str
+
+
+class _ValueOnlyModel(BaseModelWithConfig):
+    value: int
+
+
+class _InvalidDefaultModel(BaseModelWithConfig):
+    value: int = "invalid_default"  # type: ignore
+
 
 class TestBaseModelWithConfig:
     """Test BaseModelWithConfig functionality."""
 
     def test_should_create_model_with_valid_data(self):
         """Test that model creation works with valid data."""
-
-        class TestModel(BaseModelWithConfig):
-            name: str
-            value: int
-
-        model = TestModel(name="test", value=42)
+        model = _NameValueModel(name="test", value=42)
         assert model.name == "test"
         assert model.value == 42
 
     def test_should_strip_whitespace_from_strings(self):
         """Test that string fields are automatically stripped."""
-
-        class TestModel(BaseModelWithConfig):
-            name: str
-
-        model = TestModel(name="  test  ")
+        model = _NameOnlyModel(name="  test  ")
         assert model.name == "test"
 
     def test_should_forbid_extra_fields(self):
         """Test that extra fields are forbidden."""
-
-        class TestModel(BaseModelWithConfig):
-            name: str
-
         with pytest.raises(ValueError, match="Extra inputs are not permitted"):
-            TestModel(name="test", extra_field="should_fail")
+            _NameOnlyModel(name="test", extra_field="should_fail")
 
     def test_should_validate_on_assignment(self):
         """Test that validation occurs on field assignment."""
-
-        class TestModel(BaseModelWithConfig):
-            value: int
-
-        model = TestModel(value=42)
+        model = _ValueOnlyModel(value=42)
 
         with pytest.raises(ValueError):
             model.value = "not_an_int"
 
     def test_should_validate_default_values(self):
         """Test that default values are validated."""
-
         # Pydantic V2 validates on instantiation, not class definition
-        class TestModel(BaseModelWithConfig):
-            value: int = "invalid_default"  # type: ignore
+        assert _InvalidDefaultModel.model_fields["value"].default == "invalid_default"
 
         # The validation happens when creating an instance
         with pytest.raises((ValidationError, ValueError)):
-            TestModel()
+            _InvalidDefaultModel()
 
 
 class TestTimestampedModel:
     """Test TimestampedModel functionality."""
 
-    def test_should_create_with_automatic_timestamp(self):
+    def test_should_create_with_automatic_timestamp(self, frozen_now):
         """Test that created_at is automatically set."""
-        before = datetime.now(UTC)
         model = TimestampedModel()
-        after = datetime.now(UTC)
 
-        assert before <= model.created_at <= after
+        assert model.created_at == frozen_now
         assert model.updated_at is None
 
     def test_should_accept_custom_created_at(self):
@@ -87,31 +104,28 @@ class TestTimestampedModel:
 
         assert model.created_at == custom_time
 
-    def test_should_mark_updated_correctly(self):
+    def test_should_mark_updated_correctly(self, frozen_now, time_machine):
         """Test that mark_updated sets updated_at timestamp."""
         model = TimestampedModel()
         original_created = model.created_at
 
-        # Small delay to ensure different timestamps
-        import time
-
-        time.sleep(0.01)
+        # Advance the clock to ensure different timestamps
+        time_machine.shift(timedelta(seconds=1))
 
         model.mark_updated()
 
         assert model.created_at == original_created
         assert model.updated_at is not None
         assert model.updated_at > model.created_at
+        assert model.updated_at == frozen_now + timedelta(seconds=1)
 
-    def test_should_update_timestamp_on_multiple_calls(self):
+    def test_should_update_timestamp_on_multiple_calls(self, frozen_now, time_machine):
         """Test that multiple mark_updated calls update the timestamp."""
         model = TimestampedModel()
         model.mark_updated()
         first_update = model.updated_at
 
-        import time
-
-        time.sleep(0.01)
+        time_machine.shift(timedelta(seconds=1))
 
         model.mark_updated()
 
@@ -119,12 +133,9 @@ class TestTimestampedModel:
 
     def test_should_inherit_base_config(self):
         """Test that TimestampedModel inherits base configuration."""
-
-        class TestTimestampedModel(TimestampedModel):
-            name: str
-
-        model = TestTimestampedModel(name="  test  ")
-        assert model.name == "test"  # Whitespace stripped
+        assert TimestampedModel.model_config == BaseModelWithConfig.model_config
+        assert TimestampedModel.model_config.get("str_strip_whitespace") is True
+        assert TimestampedModel.model_config.get("extra") == "forbid"
 
 
 class TestAPIResponse:
@@ -192,16 +203,7 @@ class TestAPIResponse:
             data={"test": "value"}, message="Success"
         )
 
-        response_dict = response.model_dump()
-
-        expected = {
-            "success": True,
-            "message": "Success",
-            "data": {"test": "value"},
-            "errors": None,
-        }
-
-        assert response_dict == expected
+        assert response.model_dump() == EXPECTED_API_SUCCESS_DUMP
 
 
 class TestPaginatedResponse:
@@ -222,16 +224,16 @@ class TestPaginatedResponse:
 
     def test_should_create_paginated_response_with_custom_pagination(self):
         """Test creating paginated response with custom page and size."""
-        items = list(range(10))
         total = 100
         page = 2
         size = 10
 
+        # Pydantic coerces the tuple into the validated list
         response = PaginatedResponse.create(
-            items=items, total=total, page=page, size=size
+            items=PAGE_ITEMS, total=total, page=page, size=size
         )
 
-        assert response.items == items
+        assert tuple(response.items) == PAGE_ITEMS
         assert response.total == total
         assert response.page == page
         assert response.size == size
@@ -257,47 +259,31 @@ class TestPaginatedResponse:
         assert response.total == 0
         assert response.pages == 1  # Always at least 1 page
 
-    def test_should_validate_pagination_constraints(self):
+    @pytest.mark.parametrize(
+        "overrides,error_pattern",
+        [
+            ({"items": [1, 2, 3], "total": 3}, None),
+            ({"total": -1}, "greater than or equal to 0"),
+            ({"page": 0}, "greater than or equal to 1"),
+            ({"size": 101}, "less than or equal to 100"),
+        ],
+        ids=["valid", "negative_total", "page_zero", "size_too_large"],
+    )
+    def test_should_validate_pagination_constraints(self, overrides, error_pattern):
         """Test that pagination validates constraints."""
-        # Valid pagination
-        response = PaginatedResponse(items=[1, 2, 3], total=3, page=1, size=10, pages=1)
-        assert response.page == 1
-
-        # Test validation constraints
-        with pytest.raises(ValueError):
-            PaginatedResponse(
-                items=[],
-                total=-1,
-                page=1,
-                size=10,
-                pages=1,  # Invalid: negative total
-            )
-
-        with pytest.raises(ValueError):
-            PaginatedResponse(
-                items=[],
-                total=10,
-                page=0,  # Invalid: page must be >= 1
-                size=10,
-                pages=1,
-            )
-
-        with pytest.raises(ValueError):
-            PaginatedResponse(
-                items=[],
-                total=10,
-                page=1,
-                size=101,
-                pages=1,  # Invalid: size too large
-            )
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            response = PaginatedResponse(**{**VALID_PAGINATION, **overrides})
+            assert response.page == 1
 
     def test_should_serialize_correctly(self):
         """Test that PaginatedResponse serializes correctly."""
-        items = ["item1", "item2"]
-        response = PaginatedResponse.create(items=items, total=25, page=2, size=5)
-
-        response_dict = response.model_dump()
-
-        expected = {"items": items, "total": 25, "page": 2, "size": 5, "pages": 5}
+        response = PaginatedResponse.create(
+            items=["item1", "item2"], total=25, page=2, size=5
+        )
 
-        assert response_dict == expected
+        assert response.model_dump() == EXPECTED_PAGINATED_DUMP
@@ -1,9 +1,12 @@
 """Comprehensive tests for Decision model."""
 
-from datetime import UTC, datetime, timedelta
+from contextlib import nullcontext
+from datetime import timedelta
+from functools import partial
+from types import MappingProxyType
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from src.models.decision import (
     Decision,
@@ -11,30 +14,71 @@ from src.models.decision import (
     DecisionStatus,
     DecisionUpdate,
 )
+from tests.utils import factories
 from tests.utils.model_helpers import create_decision_with_past_date
 
+DECISION_LIST_ADAPTER = TypeAdapter(list[Decision])
+
+EXPECTED_DECISION_UPDATE_DUMP = MappingProxyType(
+    {
+        "decision": "New decision text",
+        "status": "deferred",
+        "rationale": None,
+        "tags": ["updated", "test"],
+        "confidence_level": 0.9,
+    }
+)
+
 
 class TestDecision:
     """Test Decision model functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_decision_data(self):
-        """Fixture providing valid decision data."""
-        return {
-            "decision": "Adopt React for the new frontend project",
-            "made_by": "Sarah Chen (CTO)",
-            "rationale": "React has better team expertise and component reusability",
-            "impact": DecisionImpact.HIGH,
-        }
+        """Fixture providing valid decision data.
+
+        Built once per module as a read-only mapping; tests override fields
+        through ``make_decision(...)`` instead of mutating it.
+        """
+        return MappingProxyType(
+            {
+                "decision": "Adopt React for the new frontend project",
+                "made_by": "Sarah Chen (CTO)",
+                "rationale": (
+                    "React has better team expertise and component reusability"
+                ),
+                "impact": DecisionImpact.HIGH,
+            }
+        )
+
+    @pytest.fixture(scope="class")
+    def make_decision(self, valid_decision_data):
+        """Fixture binding the valid data onto ``factories.make_decision``.
+
+        Call-time keywords override the bound data, and ``validate=False``
+        works as it does on the shared factory.
+        """
+        return partial(factories.make_decision, **valid_decision_data)
+
+    @pytest.fixture(scope="module")
+    def baseline_decision(self, valid_decision_data):
+        """Fixture providing one validated Decision shared across the module.
+
+        Tests that mutate a decision work on ``baseline_decision.model_copy()``
+        so the shared instance is never changed.
+        """
+        return Decision(**valid_decision_data)
 
-    @pytest.fixture
-    def future_date(self):
+    @pytest.fixture(scope="module")
+    def future_date(self, now_utc):
         """Fixture providing a future date."""
-        return datetime.now(UTC) + timedelta(days=30)
+        return now_utc + timedelta(days=30)
 
-    def test_should_create_decision_with_valid_data(self, valid_decision_data):
+    def test_should_create_decision_with_valid_data(
+        self, valid_decision_data, baseline_decision
+    ):
         """Test creating Decision with valid data."""
-        decision = Decision(**valid_decision_data)
+        decision = baseline_decision
 
         assert decision.decision == valid_decision_data["decision"]
         assert decision.made_by == valid_decision_data["made_by"]
@@ -47,164 +91,173 @@ class TestDecision:
         assert decision.tags == []  # default
         assert decision.dependencies == []  # default
 
-    def test_should_generate_unique_id(self, valid_decision_data):
+    def test_should_generate_unique_id(self, make_decision):
         """Test that each Decision gets a unique ID."""
-        decision1 = Decision(**valid_decision_data)
-        decision2 = Decision(**valid_decision_data)
+        decision1 = make_decision()
+        decision2 = make_decision()
 
         assert decision1.id != decision2.id
         assert str(decision1.id)  # Should be valid UUID string
 
-    def test_should_set_automatic_timestamp(self, valid_decision_data):
+    def test_should_set_automatic_timestamp(self, make_decision, frozen_now):
         """Test that timestamp is automatically set."""
-        before = datetime.now(UTC)
-        decision = Decision(**valid_decision_data)
-        after = datetime.now(UTC)
-
-        assert before <= decision.timestamp <= after
-        assert before <= decision.created_at <= after
-
-    def test_should_validate_decision_length(self, valid_decision_data):
+        decision = make_decision()
+
+        assert decision.timestamp == frozen_now
+        assert decision.created_at == frozen_now
+
+    @pytest.mark.parametrize(
+        "text,error_pattern",
+        [
+            ("hi", "at least 5 characters"),
+            ("x" * 1001, "at most 1000 characters"),
+            ("We will use TypeScript for better type safety", None),
+        ],
+        ids=["too_short", "too_long", "valid"],
+    )
+    def test_should_validate_decision_length(self, make_decision, text, error_pattern):
         """Test decision text length validation."""
-        # Too short
-        with pytest.raises(ValueError, match="at least 5 characters"):
-            Decision(**{**valid_decision_data, "decision": "hi"})
-
-        # Too long
-        long_decision = "x" * 1001
-        with pytest.raises(ValueError, match="at most 1000 characters"):
-            Decision(**{**valid_decision_data, "decision": long_decision})
-
-        # Valid length
-        valid_decision = "We will use TypeScript for better type safety"
-        decision = Decision(**{**valid_decision_data, "decision": valid_decision})
-        assert decision.decision == valid_decision
-
-    def test_should_validate_made_by_format(self, valid_decision_data):
-        """Test made_by field validation."""
-        # Empty name
-        with pytest.raises(
-            ValidationError, match="String should have at least 1 character"
-        ):
-            Decision(**{**valid_decision_data, "made_by": ""})
-
-        # Invalid characters
-        with pytest.raises(ValueError, match="invalid characters"):
-            Decision(**{**valid_decision_data, "made_by": "Alice@Johnson"})
-
-        # Valid formats
-        valid_names = [
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            decision = make_decision(decision=text)
+            assert decision.decision == text
+
+    @pytest.mark.parametrize(
+        "name,error_pattern",
+        [
+            pytest.param("", "String should have at least 1 character", id="empty"),
+            pytest.param("Alice@Johnson", "invalid characters", id="at-sign"),
+        ],
+    )
+    def test_should_reject_invalid_made_by(self, make_decision, name, error_pattern):
+        """Test made_by field validation rejects invalid names."""
+        with pytest.raises(ValidationError, match=error_pattern):
+            make_decision(made_by=name)
+
+    @pytest.mark.parametrize(
+        "name",
+        [
             "Alice Johnson",
             "Bob O'Connor (CEO)",
             "Dr. Sarah Chen",
             "Mary-Jane Smith (Product Lead)",
-        ]
-
-        for name in valid_names:
-            decision = Decision(**{**valid_decision_data, "made_by": name})
-            assert decision.made_by == name
-
-    def test_should_validate_rationale_length(self, valid_decision_data):
+        ],
+        ids=["plain", "apostrophe_role", "title", "hyphen_role"],
+    )
+    def test_should_accept_valid_made_by(self, make_decision, name):
+        """Test made_by field validation accepts valid names."""
+        decision = make_decision(made_by=name)
+        assert decision.made_by == name
+
+    def test_should_validate_rationale_length(self, make_decision):
         """Test rationale length validation."""
         # Too short
-        with pytest.raises(ValueError, match="at least 5 characters"):
-            Decision(**{**valid_decision_data, "rationale": "ok"})
+        with pytest.raises(ValidationError, match="at least 5 characters"):
+            make_decision(rationale="ok")
 
         # Too long
         long_rationale = "x" * 2001
-        with pytest.raises(ValueError, match="at most 2000 characters"):
-            Decision(**{**valid_decision_data, "rationale": long_rationale})
+        with pytest.raises(ValidationError, match="at most 2000 characters"):
+            make_decision(rationale=long_rationale)
 
-    def test_should_validate_future_dates(self, valid_decision_data):
+    @pytest.mark.parametrize("field", ["implementation_date", "review_date"])
+    def test_should_validate_future_dates(self, make_decision, now_utc, field):
         """Test that implementation and review dates cannot be in the past."""
-        past_date = datetime.now(UTC) - timedelta(days=1)
+        past_date = now_utc - timedelta(days=1)
 
-        with pytest.raises(ValueError, match="cannot be in the past"):
-            Decision(**{**valid_decision_data, "implementation_date": past_date})
+        with pytest.raises(ValidationError, match="cannot be in the past"):
+            make_decision(**{field: past_date})
 
-        with pytest.raises(ValueError, match="cannot be in the past"):
-            Decision(**{**valid_decision_data, "review_date": past_date})
-
-    def test_should_accept_future_dates(self, valid_decision_data, future_date):
+    def test_should_accept_future_dates(self, make_decision, future_date):
         """Test that future dates are accepted."""
-        decision = Decision(
-            **{
-                **valid_decision_data,
-                "implementation_date": future_date,
-                "review_date": future_date + timedelta(days=30),
-            }
+        decision = make_decision(
+            implementation_date=future_date,
+            review_date=future_date + timedelta(days=30),
         )
 
         assert decision.implementation_date == future_date
         assert decision.review_date == future_date + timedelta(days=30)
 
-    def test_should_clean_string_lists(self, valid_decision_data):
+    @pytest.mark.parametrize(
+        "items,expected",
+        [
+            (
+                ["  Frontend Team  ", "BACKEND", "frontend team", "QA", "x"],
+                ["Frontend Team", "BACKEND", "QA"],
+            ),
+            (["Vue.js", "  Angular  ", "vue.js"], ["Vue.js", "Angular"]),
+            (["tech", "  FRONTEND  ", "tech", "ui"], ["tech", "FRONTEND", "ui"]),
+            (["Training", "  SETUP  ", "training"], ["Training", "SETUP"]),
+        ],
+        ids=[
+            "strip_dedup_min_length",
+            "strip_case_dedup",
+            "exact_duplicate",
+            "first_casing_wins",
+        ],
+    )
+    def test_should_clean_string_lists(self, items, expected):
         """Test cleaning of string list fields."""
-        decision = Decision(
-            **{
-                **valid_decision_data,
-                "affected_teams": [
-                    "  Frontend Team  ",
-                    "BACKEND",
-                    "frontend team",
-                    "QA",
-                    "x",
-                ],
-                "alternatives_considered": ["Vue.js", "  Angular  ", "vue.js"],
-                "tags": ["tech", "  FRONTEND  ", "tech", "ui"],
-                "dependencies": ["Training", "  SETUP  ", "training"],
-            }
+        # Should be cleaned: trimmed, deduplicated, min length 2
+        assert Decision.validate_string_lists(items) == expected
+
+    def test_should_apply_string_list_cleaner_to_all_list_fields(self, make_decision):
+        """Test that the list cleaner runs on every string list field."""
+        decision = make_decision(
+            affected_teams=["  QA  ", "qa"],
+            alternatives_considered=["Vue.js", "x"],
+            tags=["ui", "UI"],
+            dependencies=[" Training "],
         )
 
-        # Should be cleaned: trimmed, deduplicated, min length 2
-        assert decision.affected_teams == ["Frontend Team", "BACKEND", "QA"]
-        assert decision.alternatives_considered == ["Vue.js", "Angular"]
-        assert decision.tags == ["tech", "FRONTEND", "ui"]
-        assert decision.dependencies == ["Training", "SETUP"]
+        assert decision.affected_teams == ["QA"]
+        assert decision.alternatives_considered == ["Vue.js"]
+        assert decision.tags == ["ui"]
+        assert decision.dependencies == ["Training"]
 
-    def test_should_validate_confidence_level(self, valid_decision_data):
+    def test_should_validate_confidence_level(self, make_decision):
         """Test confidence level validation."""
         # Too low
-        with pytest.raises(ValueError, match="greater than or equal to 0"):
-            Decision(**{**valid_decision_data, "confidence_level": -0.1})
+        with pytest.raises(ValidationError, match="greater than or equal to 0"):
+            make_decision(confidence_level=-0.1)
 
         # Too high
-        with pytest.raises(ValueError, match="less than or equal to 1"):
-            Decision(**{**valid_decision_data, "confidence_level": 1.1})
+        with pytest.raises(ValidationError, match="less than or equal to 1"):
+            make_decision(confidence_level=1.1)
 
         # Valid values
         for level in [0.0, 0.5, 1.0]:
-            decision = Decision(**{**valid_decision_data, "confidence_level": level})
+            decision = make_decision(confidence_level=level)
             assert decision.confidence_level == level
 
-    def test_should_mark_implemented_correctly(self, valid_decision_data):
+    def test_should_mark_implemented_correctly(self, baseline_decision, frozen_now):
         """Test marking decision as implemented."""
-        decision = Decision(**valid_decision_data)
+        decision = baseline_decision.model_copy()
 
-        before = datetime.now(UTC)
         decision.mark_implemented()
-        after = datetime.now(UTC)
 
         assert decision.status == DecisionStatus.IMPLEMENTED
-        assert before <= decision.implementation_date <= after
-        assert decision.updated_at is not None
+        assert decision.implementation_date == frozen_now
+        assert decision.updated_at == frozen_now
 
     def test_should_preserve_existing_implementation_date(
-        self, valid_decision_data, future_date
+        self, make_decision, future_date
     ):
         """Test that existing implementation date is preserved."""
-        decision = Decision(
-            **{**valid_decision_data, "implementation_date": future_date}
-        )
+        decision = make_decision(implementation_date=future_date)
 
         decision.mark_implemented()
 
         assert decision.status == DecisionStatus.IMPLEMENTED
         assert decision.implementation_date == future_date
 
-    def test_should_mark_deferred_correctly(self, valid_decision_data, future_date):
+    def test_should_mark_deferred_correctly(self, baseline_decision, future_date):
         """Test marking decision as deferred."""
-        decision = Decision(**valid_decision_data)
+        decision = baseline_decision.model_copy()
 
         decision.mark_deferred(future_date)
 
@@ -212,46 +265,51 @@ class TestDecision:
         assert decision.review_date == future_date
         assert decision.updated_at is not None
 
-    def test_should_mark_deferred_without_new_date(self, valid_decision_data):
+    def test_should_mark_deferred_without_new_date(self, baseline_decision, now_utc):
         """Test marking decision as deferred without changing review date."""
-        original_review = datetime.now(UTC) + timedelta(days=10)
-        decision = Decision(**{**valid_decision_data, "review_date": original_review})
+        original_review = now_utc + timedelta(days=10)
+        decision = baseline_decision.model_copy(update={"review_date": original_review})
 
         decision.mark_deferred()
 
         assert decision.status == DecisionStatus.DEFERRED
         assert decision.review_date == original_review
 
-    def test_should_detect_due_for_review(self, valid_decision_data):
+    def test_should_detect_due_for_review(
+        self, valid_decision_data, baseline_decision, now_utc
+    ):
         """Test due for review detection."""
         # Past review date
-        past_date = datetime.now(UTC) - timedelta(hours=1)
+        past_date = now_utc - timedelta(hours=1)
         past_review = create_decision_with_past_date(
             valid_decision_data, past_date, "review_date"
         )
         assert past_review.is_due_for_review() is True
 
         # Future review date
-        future_date = datetime.now(UTC) + timedelta(days=1)
-        future_review = Decision(**{**valid_decision_data, "review_date": future_date})
+        future_date = now_utc + timedelta(days=1)
+        future_review = Decision.model_construct(
+            **valid_decision_data, review_date=future_date
+        )
         assert future_review.is_due_for_review() is False
 
         # No review date
-        no_review = Decision(**valid_decision_data)
-        assert no_review.is_due_for_review() is False
+        assert baseline_decision.is_due_for_review() is False
 
-    def test_should_calculate_days_until_implementation(self, valid_decision_data):
+    def test_should_calculate_days_until_implementation(
+        self, valid_decision_data, baseline_decision, now_utc
+    ):
         """Test days until implementation calculation."""
         # Future date
-        future_date = datetime.now(UTC) + timedelta(days=10)
-        future_impl = Decision(
-            **{**valid_decision_data, "implementation_date": future_date}
+        future_date = now_utc + timedelta(days=10)
+        future_impl = Decision.model_construct(
+            **valid_decision_data, implementation_date=future_date
         )
         # Allow for 9 or 10 days due to timezone/precision differences
         assert future_impl.days_until_implementation() in [9, 10]
 
         # Past date (negative days)
-        past_date = datetime.now(UTC) - timedelta(days=5)
+        past_date = now_utc - timedelta(days=5)
         past_impl = create_decision_with_past_date(
             valid_decision_data, past_date, "implementation_date"
         )
@@ -259,26 +317,25 @@ class TestDecision:
         assert past_impl.days_until_implementation() in [-6, -5]
 
         # No implementation date
-        no_impl = Decision(**valid_decision_data)
-        assert no_impl.days_until_implementation() is None
-
-    def test_should_handle_all_enum_values(self, valid_decision_data):
-        """Test that all enum values work correctly."""
-        # Test all status values
-        for status in DecisionStatus:
-            decision = Decision(**{**valid_decision_data, "status": status})
-            assert decision.status == status
-
-        # Test all impact values
-        for impact in DecisionImpact:
-            decision = Decision(**{**valid_decision_data, "impact": impact})
-            assert decision.impact == impact
-
-    def test_should_serialize_correctly(self, valid_decision_data, future_date):
+        assert baseline_decision.days_until_implementation() is None
+
+    @pytest.mark.parametrize(
+        "field,enum_cls",
+        [("status", DecisionStatus), ("impact", DecisionImpact)],
+        ids=["status", "impact"],
+    )
+    def test_should_accept_each_enum_value(self, valid_decision_data, field, enum_cls):
+        """Test that every status and impact value works correctly."""
+        payloads = [{**valid_decision_data, field: member.value} for member in enum_cls]
+
+        decisions = DECISION_LIST_ADAPTER.validate_python(payloads)
+
+        assert [getattr(d, field) for d in decisions] == list(enum_cls)
+
+    def test_should_serialize_correctly(self, baseline_decision, future_date):
         """Test Decision serialization."""
-        decision = Decision(
-            **{
-                **valid_decision_data,
+        decision = baseline_decision.model_copy(
+            update={
                 "implementation_date": future_date,
                 "affected_teams": ["Team A", "Team B"],
                 "alternatives_considered": ["Option 1", "Option 2"],
@@ -287,21 +344,33 @@ class TestDecision:
             }
         )
 
-        data = decision.model_dump()
+        data = decision.model_dump(
+            include={
+                "id",
+                "timestamp",
+                "created_at",
+                "status",
+                "impact",
+                "implementation_date",
+                "affected_teams",
+                "alternatives_considered",
+                "tags",
+                "confidence_level",
+            }
+        )
 
-        # Check key fields are present
-        assert data["decision"] == valid_decision_data["decision"]
-        assert data["made_by"] == valid_decision_data["made_by"]
-        assert data["rationale"] == valid_decision_data["rationale"]
-        assert data["status"] == "approved"  # Enum value
-        assert data["impact"] == "high"  # Enum value
-        assert data["affected_teams"] == ["Team A", "Team B"]
-        assert data["alternatives_considered"] == ["Option 1", "Option 2"]
-        assert data["tags"] == ["tech", "frontend"]
-        assert data["confidence_level"] == 0.8
-        assert "id" in data
-        assert "timestamp" in data
-        assert "created_at" in data
+        assert data == {
+            "id": decision.id,
+            "timestamp": decision.timestamp,
+            "created_at": decision.created_at,
+            "status": "approved",  # Enum value
+            "impact": "high",  # Enum value
+            "implementation_date": future_date,
+            "affected_teams": ["Team A", "Team B"],
+            "alternatives_considered": ["Option 1", "Option 2"],
+            "tags": ["tech", "frontend"],
+            "confidence_level": 0.8,
+        }
 
 
 class TestDecisionUpdate:
@@ -321,15 +390,15 @@ class TestDecisionUpdate:
     def test_should_validate_updated_fields(self):
         """Test that updated fields are validated."""
         # Invalid decision length
-        with pytest.raises(ValueError, match="at least 5 characters"):
+        with pytest.raises(ValidationError, match="at least 5 characters"):
             DecisionUpdate(decision="hi")
 
         # Invalid rationale length
-        with pytest.raises(ValueError, match="at least 5 characters"):
+        with pytest.raises(ValidationError, match="at least 5 characters"):
             DecisionUpdate(rationale="ok")
 
         # Invalid confidence level
-        with pytest.raises(ValueError, match="greater than or equal to 0"):
+        with pytest.raises(ValidationError, match="greater than or equal to 0"):
             DecisionUpdate(confidence_level=-0.1)
 
     def test_should_allow_all_none_values(self):
@@ -342,9 +411,9 @@ class TestDecisionUpdate:
         assert update.impact is None
         assert update.confidence_level is None
 
-    def test_should_serialize_correctly(self):
+    def test_should_serialize_correctly(self, now_utc):
         """Test DecisionUpdate serialization."""
-        future_date = datetime.now(UTC) + timedelta(days=14)
+        future_date = now_utc + timedelta(days=14)
 
         update = DecisionUpdate(
             decision="New decision text",
@@ -354,10 +423,6 @@ class TestDecisionUpdate:
             confidence_level=0.9,
         )
 
-        data = update.model_dump()
+        data = update.model_dump(include=set(EXPECTED_DECISION_UPDATE_DUMP))
 
-        assert data["decision"] == "New decision text"
-        assert data["status"] == "deferred"
-        assert data["rationale"] is None
-        assert data["tags"] == ["updated", "test"]
-        assert data["confidence_level"] == 0.9
+        assert data == EXPECTED_DECISION_UPDATE_DUMP
@@ -1,6 +1,9 @@
 """Comprehensive tests for transcript models."""
 
+from contextlib import nullcontext
 from datetime import UTC, datetime, timedelta
+from functools import partial
+from types import MappingProxyType
 from uuid import UUID
 
 import pytest
@@ -16,24 +19,95 @@ from src.models.transcript import (
     TranscriptStatus,
 )
 
+VALID_TRANSCRIPT_DATA = MappingProxyType(
+    {
+        "meeting_id": "standup_2025_01_15_team_alpha",
+        "raw_text": "John: Good morning everyone. Let's discuss our progress...",
+        "participants": ["John Smith", "Alice Johnson", "Bob Wilson"],
+        "duration_minutes": 30,
+        "meeting_type": MeetingType.STANDUP,
+    }
+)
+
+VALID_STATUS_DATA = MappingProxyType(
+    {
+        "meeting_id": "meeting_123",
+        "status": TranscriptStatus.UPLOADED,
+    }
+)
+
+# Oversized inputs one past each limit, built once at import (tuples stay immutable)
+LONG_MEETING_ID = "x" * 101
+LONG_RAW_TEXT = "x" * 100001
+LONG_SUMMARY = "x" * 5001
+TOO_MANY_PARTICIPANTS = tuple(f"Person {i}" for i in range(51))
+TOO_MANY_TOPICS = tuple(f"Topic {i}" for i in range(21))
+
+MESSY_PARTICIPANTS = (
+    "  John Smith  ",
+    "ALICE JOHNSON",
+    "alice johnson",  # Duplicate
+    "",  # Empty
+    "Bob Wilson",
+    "   ",  # Whitespace only
+)
+
+
+def _construct_init(self, **data):
+    """Stand-in __init__ that fills the instance via model_construct (no validation)."""
+    constructed = type(self).model_construct(**data)
+    for attr in (
+        "__dict__",
+        "__pydantic_fields_set__",
+        "__pydantic_extra__",
+        "__pydantic_private__",
+    ):
+        object.__setattr__(self, attr, getattr(constructed, attr))
+
+
+@pytest.fixture(autouse=True)
+def maybe_skip_validation(request, monkeypatch):
+    """Fixture building the transcript models without validation under --fast.
+
+    Only happy-path tests still run then; anything relying on a validator
+    carries the needs_validation marker and is skipped by conftest.
+    """
+    if request.config.getoption("--fast"):
+        for model_cls in (TranscriptInput, MeetingSummary, ProcessingStatus):
+            monkeypatch.setattr(model_cls, "__init__", _construct_init)
+
 
 class TestTranscriptInput:
     """Test TranscriptInput model functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_transcript_data(self):
-        """Fixture providing valid transcript input data."""
-        return {
-            "meeting_id": "standup_2025_01_15_team_alpha",
-            "raw_text": "John: Good morning everyone. Let's discuss our progress...",
-            "participants": ["John Smith", "Alice Johnson", "Bob Wilson"],
-            "duration_minutes": 30,
-            "meeting_type": MeetingType.STANDUP,
-        }
+        """Fixture providing valid transcript input data.
+
+        A read-only mapping; tests override fields through
+        ``make_transcript(...)`` instead of mutating it.
+        """
+        return VALID_TRANSCRIPT_DATA
 
-    def test_should_create_transcript_with_valid_data(self, valid_transcript_data):
+    @pytest.fixture(scope="class")
+    def make_transcript(self, valid_transcript_data):
+        """Fixture returning a factory that overrides fields of the valid data."""
+        return partial(TranscriptInput, **valid_transcript_data)
+
+    @pytest.fixture(scope="class")
+    def transcript_template(self, valid_transcript_data):
+        """Fixture providing one validated TranscriptInput for the class.
+
+        Tests that need a variant use ``model_copy(update=...)``, which skips
+        validation, so only do that where validation is not under test.
+        """
+        return TranscriptInput(**valid_transcript_data)
+
+    def test_should_create_transcript_with_valid_data(
+        self, valid_transcript_data, transcript_template
+    ):
         """Test creating TranscriptInput with valid data."""
-        transcript = TranscriptInput(**valid_transcript_data)
+        transcript = transcript_template
 
         assert transcript.meeting_id == valid_transcript_data["meeting_id"]
         assert transcript.raw_text == valid_transcript_data["raw_text"]
@@ -43,218 +117,245 @@ class TestTranscriptInput:
         assert transcript.audio_url is None  # Not provided
         assert transcript.metadata == {}  # Default
 
-    def test_should_set_automatic_meeting_date(self, valid_transcript_data):
+    def test_should_set_automatic_meeting_date(self, make_transcript, frozen_now):
         """Test that meeting_date is automatically set."""
-        before = datetime.now(UTC)
-        transcript = TranscriptInput(**valid_transcript_data)
-        after = datetime.now(UTC)
+        transcript = make_transcript()
 
-        assert before <= transcript.meeting_date <= after
+        assert transcript.meeting_date == frozen_now
 
-    def test_should_accept_custom_meeting_date(self, valid_transcript_data):
+    def test_should_accept_custom_meeting_date(self, make_transcript):
         """Test that custom meeting_date can be provided."""
         custom_date = datetime(2025, 1, 15, 10, 0, 0, tzinfo=UTC)
-        transcript = TranscriptInput(
-            **{**valid_transcript_data, "meeting_date": custom_date}
-        )
+        transcript = make_transcript(meeting_date=custom_date)
 
         assert transcript.meeting_date == custom_date
 
-    def test_should_validate_meeting_id_format(self, valid_transcript_data):
+    @pytest.mark.parametrize(
+        "meeting_id,error_pattern",
+        [
+            ("meeting@with#special$chars", "String should match pattern"),
+            ("", "String should have at least 1 character"),
+            (LONG_MEETING_ID, "at most 100 characters"),
+            ("meeting-123", None),
+            ("standup_team_alpha", None),
+            ("call_2025-01-15", None),
+            ("MEETING123", None),
+        ],
+        ids=[
+            "special_chars",
+            "empty",
+            "too_long",
+            "hyphen",
+            "underscore",
+            "date",
+            "uppercase",
+        ],
+    )
+    @pytest.mark.needs_validation
+    def test_should_validate_meeting_id_format(
+        self, make_transcript, meeting_id, error_pattern
+    ):
         """Test meeting ID format validation."""
-        # Invalid characters
-        with pytest.raises(ValueError, match="String should match pattern"):
-            TranscriptInput(
-                **{**valid_transcript_data, "meeting_id": "meeting@with#special$chars"}
-            )
-
-        # Too short
-        with pytest.raises(
-            ValidationError, match="String should have at least 1 character"
-        ):
-            TranscriptInput(**{**valid_transcript_data, "meeting_id": ""})
-
-        # Too long
-        long_id = "x" * 101
-        with pytest.raises(ValueError, match="at most 100 characters"):
-            TranscriptInput(**{**valid_transcript_data, "meeting_id": long_id})
-
-        # Valid formats
-        valid_ids = [
-            "meeting-123",
-            "standup_team_alpha",
-            "call_2025-01-15",
-            "MEETING123",
-        ]
-
-        for meeting_id in valid_ids:
-            transcript = TranscriptInput(
-                **{**valid_transcript_data, "meeting_id": meeting_id}
-            )
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            transcript = make_transcript(meeting_id=meeting_id)
             assert transcript.meeting_id == meeting_id
 
-    def test_should_validate_raw_text_length(self, valid_transcript_data):
+    @pytest.mark.needs_validation
+    def test_should_validate_raw_text_length(self, make_transcript):
         """Test raw text length validation."""
         # Too short
-        with pytest.raises(ValueError, match="at least 10 characters"):
-            TranscriptInput(**{**valid_transcript_data, "raw_text": "Hi there"})
+        with pytest.raises(ValidationError, match="at least 10 characters"):
+            make_transcript(raw_text="Hi there")
 
         # Too long
-        long_text = "x" * 100001
-        with pytest.raises(ValueError, match="at most 100000 characters"):
-            TranscriptInput(**{**valid_transcript_data, "raw_text": long_text})
-
-    def test_should_validate_audio_url_format(self, valid_transcript_data):
+        with pytest.raises(ValidationError, match="at most 100000 characters"):
+            make_transcript(raw_text=LONG_RAW_TEXT)
+
+    @pytest.mark.parametrize(
+        "audio_url,error_pattern",
+        [
+            ("not-a-valid-url", "String should match pattern"),
+            ("https://example.com/meeting.mp3", None),
+            ("http://storage.com/audio.wav", None),
+            ("https://cdn.com/recording.m4a", None),
+            ("https://bucket.s3.com/file.mp4", None),
+        ],
+        ids=["invalid", "mp3", "wav_http", "m4a", "mp4"],
+    )
+    @pytest.mark.needs_validation
+    def test_should_validate_audio_url_format(
+        self, make_transcript, audio_url, error_pattern
+    ):
         """Test audio URL format validation."""
-        # Invalid format
-        with pytest.raises(ValueError, match="String should match pattern"):
-            TranscriptInput(
-                **{
-                    **valid_transcript_data,
-                    "audio_url": "not-a-valid-url",
-                    "raw_text": None,
-                }
-            )
-
-        # Valid URLs
-        valid_urls = [
-            "https://example.com/meeting.mp3",
-            "http://storage.com/audio.wav",
-            "https://cdn.com/recording.m4a",
-            "https://bucket.s3.com/file.mp4",
-        ]
-
-        for url in valid_urls:
-            transcript = TranscriptInput(
-                **{**valid_transcript_data, "audio_url": url, "raw_text": None}
-            )
-            assert transcript.audio_url == url
-
-    def test_should_allow_optional_content_source(self, valid_transcript_data):
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            transcript = make_transcript(audio_url=audio_url, raw_text=None)
+            assert transcript.audio_url == audio_url
+
+    def test_should_allow_optional_content_source(self, make_transcript):
         """Test that raw_text and audio_url are both optional."""
         # Both fields are optional in the current model
-        transcript = TranscriptInput(
-            **{**valid_transcript_data, "raw_text": None, "audio_url": None}
-        )
+        transcript = make_transcript(raw_text=None, audio_url=None)
         assert transcript.raw_text is None
         assert transcript.audio_url is None
 
-    def test_should_validate_participants_list(self, valid_transcript_data):
+    @pytest.mark.needs_validation
+    def test_should_validate_participants_list(self, make_transcript):
         """Test participants list validation."""
         # Empty list
         with pytest.raises(
             ValidationError, match="List should have at least 1 item after validation"
         ):
-            TranscriptInput(**{**valid_transcript_data, "participants": []})
+            make_transcript(participants=[])
 
         # Too many participants
-        too_many = [f"Person {i}" for i in range(51)]
-        with pytest.raises(ValueError, match="at most 50 items"):
-            TranscriptInput(**{**valid_transcript_data, "participants": too_many})
+        with pytest.raises(ValidationError, match="at most 50 items"):
+            make_transcript(participants=TOO_MANY_PARTICIPANTS)
 
-    def test_should_clean_participants_list(self, valid_transcript_data):
+    @pytest.mark.needs_validation
+    def test_should_clean_participants_list(self, make_transcript):
         """Test participants list cleaning."""
-        messy_participants = [
-            "  John Smith  ",
-            "ALICE JOHNSON",
-            "alice johnson",  # Duplicate
-            "",  # Empty
-            "Bob Wilson",
-            "   ",  # Whitespace only
-        ]
-
-        transcript = TranscriptInput(
-            **{**valid_transcript_data, "participants": messy_participants}
-        )
+        transcript = make_transcript(participants=MESSY_PARTICIPANTS)
 
-        # Should be cleaned: trimmed, deduplicated (case-insensitive), empty removed
+        # Should be cleaned: trimmed, deduplicated (case-insensitive), empty removed.
+        # First-seen order and spelling are part of the contract, so compare lists.
         expected = ["John Smith", "ALICE JOHNSON", "Bob Wilson"]
         assert transcript.participants == expected
 
-    def test_should_validate_duration_minutes(self, valid_transcript_data):
+    @pytest.mark.parametrize(
+        "duration,error_pattern",
+        [
+            (0, "greater than 0"),
+            (481, "less than or equal to 480"),  # Over 8 hours
+            (1, None),
+            (60, None),
+            (240, None),
+            (480, None),
+        ],
+        ids=["zero", "over_8_hours", "1", "60", "240", "480"],
+    )
+    @pytest.mark.needs_validation
+    def test_should_validate_duration_minutes(
+        self, make_transcript, duration, error_pattern
+    ):
         """Test duration validation."""
-        # Too short
-        with pytest.raises(ValueError, match="greater than 0"):
-            TranscriptInput(**{**valid_transcript_data, "duration_minutes": 0})
-
-        # Too long (over 8 hours)
-        with pytest.raises(ValueError, match="less than or equal to 480"):
-            TranscriptInput(**{**valid_transcript_data, "duration_minutes": 481})
-
-        # Valid durations
-        for duration in [1, 60, 240, 480]:
-            transcript = TranscriptInput(
-                **{**valid_transcript_data, "duration_minutes": duration}
-            )
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            transcript = make_transcript(duration_minutes=duration)
             assert transcript.duration_minutes == duration
 
-    def test_should_handle_all_meeting_types(self, valid_transcript_data):
-        """Test that all meeting types work correctly."""
-        for meeting_type in MeetingType:
-            transcript = TranscriptInput(
-                **{**valid_transcript_data, "meeting_type": meeting_type}
-            )
-            assert transcript.meeting_type == meeting_type
-
-    def test_should_serialize_correctly(self, valid_transcript_data):
-        """Test TranscriptInput serialization."""
-        transcript = TranscriptInput(
-            **{
-                **valid_transcript_data,
-                "metadata": {"platform": "zoom", "recording_id": "123456"},
-            }
-        )
+    @pytest.mark.parametrize(
+        "meeting_type", list(MeetingType), ids=[m.name for m in MeetingType]
+    )
+    def test_should_accept_each_meeting_type(self, make_transcript, meeting_type):
+        """Test that every meeting type works correctly."""
+        transcript = make_transcript(meeting_type=meeting_type)
+        assert transcript.meeting_type == meeting_type
+
+    @pytest.mark.needs_validation
+    def test_should_reject_unknown_meeting_type(self, make_transcript):
+        """Test that a meeting type outside the enum is rejected."""
+        with pytest.raises(ValidationError, match="Input should be"):
+            make_transcript(meeting_type="webinar")
+
+    def test_should_expose_fields_as_attributes(
+        self, valid_transcript_data, make_transcript
+    ):
+        """Test that plain TranscriptInput fields read back and serialize."""
+        metadata = {"platform": "zoom", "recording_id": "123456"}
+        transcript = make_transcript(metadata=metadata)
 
-        data = transcript.model_dump()
+        assert transcript.meeting_id == valid_transcript_data["meeting_id"]
+        assert transcript.raw_text == valid_transcript_data["raw_text"]
+        assert transcript.participants == valid_transcript_data["participants"]
+        assert transcript.duration_minutes == valid_transcript_data["duration_minutes"]
+        assert transcript.model_dump(include={"metadata"}) == {"metadata": metadata}
+
+    def test_should_dump_enum_to_value(self, transcript_template):
+        """Test that TranscriptInput serializes its enum and date fields."""
+        data = transcript_template.model_dump(include={"meeting_type", "meeting_date"})
 
-        # Check key fields are present
-        assert data["meeting_id"] == valid_transcript_data["meeting_id"]
-        assert data["raw_text"] == valid_transcript_data["raw_text"]
-        assert data["participants"] == valid_transcript_data["participants"]
-        assert data["duration_minutes"] == valid_transcript_data["duration_minutes"]
-        assert data["meeting_type"] == "standup"  # Enum value
-        assert data["metadata"] == {"platform": "zoom", "recording_id": "123456"}
-        assert "meeting_date" in data
+        assert data == {
+            "meeting_type": "standup",  # Enum value
+            "meeting_date": transcript_template.meeting_date,
+        }
 
 
 class TestMeetingSummary:
     """Test MeetingSummary model functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_action_item(self):
-        """Fixture providing a sample action item."""
+        """Fixture providing a sample action item.
+
+        Shared across the module, so tests must not mutate it.
+        """
         return ActionItem(
             task="Complete budget analysis",
             assignee="Alice Johnson",
             status=ActionItemStatus.PENDING,
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_decision(self):
-        """Fixture providing a sample decision."""
+        """Fixture providing a sample decision.
+
+        Shared across the module, so tests must not mutate it.
+        """
         return Decision(
             decision="Use React for frontend",
             made_by="CTO",
             rationale="Better team expertise",
         )
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_summary_data(self, sample_action_item, sample_decision):
-        """Fixture providing valid summary data."""
-        return {
-            "meeting_id": "standup_123",
-            "summary": "Team discussed quarterly goals and project timelines",
-            "key_topics": ["Q1 Planning", "Budget Review", "Team Capacity"],
-            "participants": ["Alice", "Bob", "Carol"],
-            "action_items": [sample_action_item],
-            "decisions": [sample_decision],
-            "confidence_score": 0.85,
-            "processing_time_seconds": 12.5,
-        }
+        """Fixture providing valid summary data as a read-only mapping."""
+        return MappingProxyType(
+            {
+                "meeting_id": "standup_123",
+                "summary": "Team discussed quarterly goals and project timelines",
+                "key_topics": ["Q1 Planning", "Budget Review", "Team Capacity"],
+                "participants": ["Alice", "Bob", "Carol"],
+                "action_items": [sample_action_item],
+                "decisions": [sample_decision],
+                "confidence_score": 0.85,
+                "processing_time_seconds": 12.5,
+            }
+        )
+
+    @pytest.fixture(scope="class")
+    def make_summary(self, valid_summary_data):
+        """Fixture returning a factory that overrides fields of the valid data."""
+        return partial(MeetingSummary, **valid_summary_data)
 
-    def test_should_create_summary_with_valid_data(self, valid_summary_data):
+    @pytest.fixture(scope="class")
+    def base_summary(self, valid_summary_data):
+        """Fixture providing one validated MeetingSummary for read-only tests.
+
+        Variants branch off with ``model_copy(update=...)``, which skips
+        validation; the shared instance itself must not be mutated.
+        """
+        return MeetingSummary(**valid_summary_data)
+
+    def test_should_create_summary_with_valid_data(
+        self, valid_summary_data, base_summary
+    ):
         """Test creating MeetingSummary with valid data."""
-        summary = MeetingSummary(**valid_summary_data)
+        summary = base_summary
 
         assert summary.meeting_id == valid_summary_data["meeting_id"]
         assert summary.summary == valid_summary_data["summary"]
@@ -267,113 +368,135 @@ class TestMeetingSummary:
         assert summary.sentiment == "neutral"  # default
         assert summary.next_steps == []  # default
 
-    def test_should_generate_unique_id(self, valid_summary_data):
+    def test_should_generate_unique_id(self, make_summary):
         """Test that each MeetingSummary gets a unique ID."""
-        summary1 = MeetingSummary(**valid_summary_data)
-        summary2 = MeetingSummary(**valid_summary_data)
+        summary1 = make_summary()
+        summary2 = make_summary()
 
         assert summary1.id != summary2.id
         assert isinstance(summary1.id, UUID)
 
-    def test_should_validate_summary_length(self, valid_summary_data):
+    @pytest.mark.needs_validation
+    def test_should_validate_summary_length(self, make_summary):
         """Test summary text length validation."""
         # Too short
-        with pytest.raises(ValueError, match="at least 10 characters"):
-            MeetingSummary(**{**valid_summary_data, "summary": "Short"})
+        with pytest.raises(ValidationError, match="at least 10 characters"):
+            make_summary(summary="Short")
 
         # Too long
-        long_summary = "x" * 5001
-        with pytest.raises(ValueError, match="at most 5000 characters"):
-            MeetingSummary(**{**valid_summary_data, "summary": long_summary})
+        with pytest.raises(ValidationError, match="at most 5000 characters"):
+            make_summary(summary=LONG_SUMMARY)
 
-    def test_should_validate_key_topics(self, valid_summary_data):
+    @pytest.mark.needs_validation
+    def test_should_validate_key_topics(self, make_summary):
         """Test key topics validation."""
         # Too few topics
         with pytest.raises(
             ValidationError, match="List should have at least 1 item after validation"
         ):
-            MeetingSummary(**{**valid_summary_data, "key_topics": []})
+            make_summary(key_topics=[])
 
         # Too many topics
-        too_many = [f"Topic {i}" for i in range(21)]
-        with pytest.raises(ValueError, match="at most 20 items"):
-            MeetingSummary(**{**valid_summary_data, "key_topics": too_many})
-
-    def test_should_validate_sentiment(self, valid_summary_data):
+        with pytest.raises(ValidationError, match="at most 20 items"):
+            make_summary(key_topics=TOO_MANY_TOPICS)
+
+    @pytest.mark.parametrize(
+        "sentiment,error_pattern",
+        [
+            ("excited", "String should match pattern"),
+            ("positive", None),
+            ("neutral", None),
+            ("negative", None),
+        ],
+        ids=["invalid", "positive", "neutral", "negative"],
+    )
+    @pytest.mark.needs_validation
+    def test_should_validate_sentiment(self, make_summary, sentiment, error_pattern):
         """Test sentiment validation."""
-        # Invalid sentiment
-        with pytest.raises(ValueError, match="String should match pattern"):
-            MeetingSummary(**{**valid_summary_data, "sentiment": "excited"})
-
-        # Valid sentiments
-        for sentiment in ["positive", "neutral", "negative"]:
-            summary = MeetingSummary(**{**valid_summary_data, "sentiment": sentiment})
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            summary = make_summary(sentiment=sentiment)
             assert summary.sentiment == sentiment
 
-    def test_should_validate_confidence_score(self, valid_summary_data):
+    @pytest.mark.parametrize(
+        "score,error_pattern",
+        [
+            (-0.1, "greater than or equal to 0"),
+            (1.1, "less than or equal to 1"),
+            (0.0, None),
+            (0.5, None),
+            (1.0, None),
+        ],
+        ids=["too_low", "too_high", "0.0", "0.5", "1.0"],
+    )
+    @pytest.mark.needs_validation
+    def test_should_validate_confidence_score(self, make_summary, score, error_pattern):
         """Test confidence score validation."""
-        # Too low
-        with pytest.raises(ValueError, match="greater than or equal to 0"):
-            MeetingSummary(**{**valid_summary_data, "confidence_score": -0.1})
-
-        # Too high
-        with pytest.raises(ValueError, match="less than or equal to 1"):
-            MeetingSummary(**{**valid_summary_data, "confidence_score": 1.1})
-
-        # Valid scores
-        for score in [0.0, 0.5, 1.0]:
-            summary = MeetingSummary(
-                **{**valid_summary_data, "confidence_score": score}
-            )
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            summary = make_summary(confidence_score=score)
             assert summary.confidence_score == score
 
-    def test_should_validate_processing_time(self, valid_summary_data):
+    @pytest.mark.parametrize(
+        "time_val,error_pattern",
+        [
+            (-1.0, "greater than or equal to 0"),
+            (0.0, None),
+            (5.5, None),
+            (120.0, None),
+        ],
+        ids=["negative", "0.0", "5.5", "120.0"],
+    )
+    @pytest.mark.needs_validation
+    def test_should_validate_processing_time(
+        self, make_summary, time_val, error_pattern
+    ):
         """Test processing time validation."""
-        # Negative time
-        with pytest.raises(ValueError, match="greater than or equal to 0"):
-            MeetingSummary(**{**valid_summary_data, "processing_time_seconds": -1.0})
-
-        # Valid times
-        for time_val in [0.0, 5.5, 120.0]:
-            summary = MeetingSummary(
-                **{**valid_summary_data, "processing_time_seconds": time_val}
-            )
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            summary = make_summary(processing_time_seconds=time_val)
             assert summary.processing_time_seconds == time_val
 
-    def test_should_compute_total_items(self, valid_summary_data):
+    def test_should_compute_total_items(self, base_summary):
         """Test total_items computed field."""
-        summary = MeetingSummary(**valid_summary_data)
-
         # 1 action item + 1 decision = 2 total items
-        assert summary.total_items == 2
+        assert base_summary.total_items == 2
 
         # Test with no items
-        summary_empty = MeetingSummary(
-            **{**valid_summary_data, "action_items": [], "decisions": []}
+        summary_empty = base_summary.model_copy(
+            update={"action_items": [], "decisions": []}
         )
         assert summary_empty.total_items == 0
 
     def test_should_compute_completion_percentage(
-        self, valid_summary_data, sample_action_item
+        self, base_summary, sample_action_item
     ):
         """Test completion_percentage computed field."""
         # Test with no action items
-        summary_no_items = MeetingSummary(**{**valid_summary_data, "action_items": []})
+        summary_no_items = base_summary.model_copy(update={"action_items": []})
         assert summary_no_items.completion_percentage == 100.0
 
         # Test with pending action item
-        summary_pending = MeetingSummary(**valid_summary_data)
-        assert summary_pending.completion_percentage == 0.0
+        assert base_summary.completion_percentage == 0.0
 
         # Test with completed action item
-        completed_item = ActionItem(
-            task="Completed task", assignee="Alice", status=ActionItemStatus.COMPLETED
+        completed_item = sample_action_item.model_copy(
+            update={"task": "Completed task", "status": ActionItemStatus.COMPLETED}
         )
-        summary_completed = MeetingSummary(
-            **{
-                **valid_summary_data,
-                "action_items": [sample_action_item, completed_item],
-            }
+        summary_completed = base_summary.model_copy(
+            update={"action_items": [sample_action_item, completed_item]}
         )
         assert summary_completed.completion_percentage == 50.0  # 1 of 2 completed
 
@@ -381,17 +504,29 @@ class TestMeetingSummary:
 class TestProcessingStatus:
     """Test ProcessingStatus model functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_status_data(self):
-        """Fixture providing valid status data."""
-        return {
-            "meeting_id": "meeting_123",
-            "status": TranscriptStatus.UPLOADED,
-        }
+        """Fixture providing valid status data as a read-only mapping."""
+        return VALID_STATUS_DATA
 
-    def test_should_create_status_with_valid_data(self, valid_status_data):
+    @pytest.fixture(scope="class")
+    def make_status(self, valid_status_data):
+        """Fixture returning a factory that overrides fields of the valid data."""
+        return partial(ProcessingStatus, **valid_status_data)
+
+    @pytest.fixture
+    def fresh_status(self, valid_status_data):
+        """Fixture providing a new, unvalidated ProcessingStatus per test.
+
+        The mark_*() tests exercise state transitions, not construction, so
+        the known-valid data skips validation via model_construct(), which
+        still applies field defaults.
+        """
+        return ProcessingStatus.model_construct(**valid_status_data)
+
+    def test_should_create_status_with_valid_data(self, valid_status_data, make_status):
         """Test creating ProcessingStatus with valid data."""
-        status = ProcessingStatus(**valid_status_data)
+        status = make_status()
 
         assert status.meeting_id == valid_status_data["meeting_id"]
         assert status.status == TranscriptStatus.UPLOADED
@@ -399,84 +534,96 @@ class TestProcessingStatus:
         assert status.error_message is None  # default
         assert status.estimated_completion is None  # default
 
-    def test_should_validate_progress_percentage(self, valid_status_data):
+    @pytest.mark.parametrize(
+        "percentage,error_pattern",
+        [
+            (-1, "greater than or equal to 0"),
+            (101, "less than or equal to 100"),
+            (0, None),
+            (50, None),
+            (100, None),
+        ],
+        ids=["too_low", "too_high", "0", "50", "100"],
+    )
+    @pytest.mark.needs_validation
+    def test_should_validate_progress_percentage(
+        self, make_status, percentage, error_pattern
+    ):
         """Test progress percentage validation."""
-        # Too low
-        with pytest.raises(ValueError, match="greater than or equal to 0"):
-            ProcessingStatus(**{**valid_status_data, "progress_percentage": -1})
-
-        # Too high
-        with pytest.raises(ValueError, match="less than or equal to 100"):
-            ProcessingStatus(**{**valid_status_data, "progress_percentage": 101})
-
-        # Valid percentages
-        for percentage in [0, 50, 100]:
-            status = ProcessingStatus(
-                **{**valid_status_data, "progress_percentage": percentage}
-            )
+        expectation = (
+            pytest.raises(ValidationError, match=error_pattern)
+            if error_pattern
+            else nullcontext()
+        )
+        with expectation:
+            status = make_status(progress_percentage=percentage)
             assert status.progress_percentage == percentage
 
-    def test_should_mark_processing_correctly(self, valid_status_data):
+    def test_should_mark_processing_correctly(self, fresh_status, frozen_now):
         """Test mark_processing method."""
-        status = ProcessingStatus(**valid_status_data)
+        status = fresh_status
 
-        before = datetime.now(UTC)
         status.mark_processing(estimated_seconds=120)
-        after = datetime.now(UTC)
 
         assert status.status == TranscriptStatus.PROCESSING
-        assert status.updated_at is not None
-        assert before <= status.updated_at <= after
-
-        # Check estimated completion time - allow some precision variance
-        expected_completion = before + timedelta(seconds=120)
-        actual_completion = status.estimated_completion
-        # Allow up to 1 second variance due to timing precision
-        assert abs((actual_completion - expected_completion).total_seconds()) <= 1
+        assert status.updated_at == frozen_now
+        assert status.estimated_completion == frozen_now + timedelta(seconds=120)
 
-    def test_should_mark_completed_correctly(self, valid_status_data):
+    def test_should_mark_completed_correctly(self, fresh_status, frozen_now):
         """Test mark_completed method."""
-        status = ProcessingStatus(**valid_status_data)
+        status = fresh_status
 
         status.mark_completed()
 
         assert status.status == TranscriptStatus.COMPLETED
         assert status.progress_percentage == 100
-        assert status.updated_at is not None
+        assert status.updated_at == frozen_now
 
-    def test_should_mark_failed_correctly(self, valid_status_data):
+    def test_should_mark_failed_correctly(self, fresh_status, frozen_now):
         """Test mark_failed method."""
-        status = ProcessingStatus(**valid_status_data)
+        status = fresh_status
         error_msg = "Transcription service unavailable"
 
         status.mark_failed(error_msg)
 
         assert status.status == TranscriptStatus.FAILED
         assert status.error_message == error_msg
-        assert status.updated_at is not None
-
-    def test_should_handle_all_status_values(self, valid_status_data):
-        """Test that all transcript status values work correctly."""
-        for transcript_status in TranscriptStatus:
-            status = ProcessingStatus(
-                **{**valid_status_data, "status": transcript_status}
-            )
-            assert status.status == transcript_status
-
-    def test_should_serialize_correctly(self, valid_status_data):
+        assert status.updated_at == frozen_now
+
+    @pytest.mark.parametrize(
+        "transcript_status",
+        list(TranscriptStatus),
+        ids=[s.name for s in TranscriptStatus],
+    )
+    def test_should_accept_each_status(self, make_status, transcript_status):
+        """Test that every transcript status value works correctly."""
+        status = make_status(status=transcript_status)
+        assert status.status == transcript_status
+
+    @pytest.mark.needs_validation
+    def test_should_reject_unknown_status(self, make_status):
+        """Test that a status outside the enum is rejected."""
+        with pytest.raises(ValidationError, match="Input should be"):
+            make_status(status="archived")
+
+    def test_should_serialize_correctly(self, valid_status_data, make_status):
         """Test ProcessingStatus serialization."""
-        status = ProcessingStatus(
-            **{
-                **valid_status_data,
-                "progress_percentage": 75,
-                "error_message": "Partial failure",
+        status = make_status(progress_percentage=75, error_message="Partial failure")
+
+        data = status.model_dump(
+            include={
+                "meeting_id",
+                "status",
+                "progress_percentage",
+                "error_message",
+                "created_at",
             }
         )
 
-        data = status.model_dump()
-
-        assert data["meeting_id"] == valid_status_data["meeting_id"]
-        assert data["status"] == "uploaded"  # Enum value
-        assert data["progress_percentage"] == 75
-        assert data["error_message"] == "Partial failure"
-        assert "created_at" in data
+        assert data == {
+            "meeting_id": valid_status_data["meeting_id"],
+            "status": "uploaded",  # Enum value
+            "progress_percentage": 75,
+            "error_message": "Partial failure",
+            "created_at": status.created_at,
+        }
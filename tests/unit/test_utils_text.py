@@ -0,0 +1,37 @@
+"""Tests for text normalization helpers."""
+
+import pytest
+
+from src.utils.text import normalize_participants
+
+
+class TestNormalizeParticipants:
+    """Test participant name normalization."""
+
+    @pytest.mark.parametrize(
+        "names,expected",
+        [
+            pytest.param(
+                ["  John Smith  ", "ALICE JOHNSON", "alice johnson", ""],
+                ["John Smith", "ALICE JOHNSON"],
+                id="strip_case_dedup_blank",
+            ),
+            pytest.param(
+                ["Bob", "Alice", "bob"], ["Bob", "Alice"], id="first_seen_order"
+            ),
+            pytest.param(["", "   "], [], id="all_blank"),
+            pytest.param([], [], id="empty"),
+        ],
+    )
+    def test_should_clean_and_deduplicate_names(self, names, expected):
+        """Test names are stripped, blank entries dropped and duplicates removed."""
+        assert normalize_participants(names) == expected
+
+    def test_should_casefold_non_ascii_names(self):
+        """Test duplicates are matched with casefold(), not just lower()."""
+        # "Straße".lower() != "STRASSE".lower(), but their casefolds match
+        assert normalize_participants(["Jan Straße", "JAN STRASSE"]) == ["Jan Straße"]
+
+    def test_should_accept_any_iterable(self):
+        """Test a generator works as well as a list."""
+        assert normalize_participants(name for name in ("Ann", " ann ")) == ["Ann"]
@@ -0,0 +1,115 @@
+"""Model factories for building test instances with sensible defaults.
+
+Each factory fills in every required field, so tests only spell out the
+fields they actually care about:
+
+    make_action_item(status=ActionItemStatus.COMPLETED)
+    make_meeting_summary(action_items=[make_action_item(), make_action_item()])
+
+Pass ``validate=False`` to build known-valid literal data through
+``model_construct()`` and skip Pydantic validation entirely.
+"""
+
+from collections.abc import Mapping
+from copy import deepcopy
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from src.models.action_item import ActionItem, ActionItemPriority, ActionItemStatus
+from src.models.decision import Decision, DecisionImpact
+from src.models.transcript import MeetingSummary
+
+# Read-only; _build deep-copies them so model_construct never shares the lists
+ACTION_ITEM_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "task": "Complete budget analysis",
+        "assignee": "Alice Johnson",
+        "status": ActionItemStatus.PENDING,
+        "priority": ActionItemPriority.MEDIUM,
+    }
+)
+
+DECISION_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "decision": "Use React for frontend framework",
+        "made_by": "Carol Davis (Tech Lead)",
+        "rationale": "Better team expertise and component reusability",
+        "impact": DecisionImpact.MEDIUM,
+    }
+)
+
+MEETING_SUMMARY_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "meeting_id": "summary_test_123",
+        "summary": "Team discussed Q1 goals and project timelines.",
+        "key_topics": ["Q1 Planning"],
+        "participants": ["Alice Johnson", "Bob Smith"],
+        "confidence_score": 0.8,
+        "processing_time_seconds": 10.0,
+    }
+)
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _build(
+    model_cls: type[ModelT],
+    defaults: Mapping[str, Any],
+    overrides: dict[str, Any],
+    validate: bool,
+) -> ModelT:
+    """Build a model from defaults plus overrides, optionally skipping validation."""
+    data = deepcopy(dict(defaults))
+    data.update(overrides)
+    if validate:
+        return model_cls(**data)
+    return model_cls.model_construct(**data)
+
+
+def make_action_item(*, validate: bool = True, **overrides: Any) -> ActionItem:
+    """Create an ActionItem, overriding any default field.
+
+    Args:
+        validate: Run Pydantic validation (False uses model_construct)
+        **overrides: Field values replacing ACTION_ITEM_DEFAULTS
+
+    Returns:
+        ActionItem instance
+    """
+    return _build(ActionItem, ACTION_ITEM_DEFAULTS, overrides, validate)
+
+
+def make_decision(*, validate: bool = True, **overrides: Any) -> Decision:
+    """Create a Decision, overriding any default field.
+
+    Args:
+        validate: Run Pydantic validation (False uses model_construct)
+        **overrides: Field values replacing DECISION_DEFAULTS
+
+    Returns:
+        Decision instance
+    """
+    return _build(Decision, DECISION_DEFAULTS, overrides, validate)
+
+
+def make_meeting_summary(*, validate: bool = True, **overrides: Any) -> MeetingSummary:
+    """Create a MeetingSummary, overriding any default field.
+
+    One default action item and decision are built per call unless
+    ``action_items`` or ``decisions`` are overridden.
+
+    Args:
+        validate: Run Pydantic validation (False uses model_construct)
+        **overrides: Field values replacing MEETING_SUMMARY_DEFAULTS
+
+    Returns:
+        MeetingSummary instance
+    """
+    if "action_items" not in overrides:
+        overrides["action_items"] = [make_action_item(validate=validate)]
+    if "decisions" not in overrides:
+        overrides["decisions"] = [make_decision(validate=validate)]
+    return _build(MeetingSummary, MEETING_SUMMARY_DEFAULTS, overrides, validate)
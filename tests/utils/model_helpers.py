@@ -4,6 +4,7 @@ This module provides utilities for creating model instances with invalid data
 for testing purposes only. These utilities should NEVER be used in production code.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
 
@@ -12,7 +13,7 @@ from src.models.decision import Decision
 
 
 def create_action_item_with_past_date(
-    data: dict[str, Any], past_date: datetime
+    data: Mapping[str, Any], past_date: datetime
 ) -> ActionItem:
     """Create ActionItem with past due_date for testing overdue scenarios.
 
@@ -21,21 +22,18 @@ def create_action_item_with_past_date(
     production validation safety.
 
     Args:
-        data: Valid ActionItem data dictionary
+        data: Valid ActionItem data mapping, without a due_date key
         past_date: A datetime in the past to set as due_date
 
     Returns:
         ActionItem instance with past due_date set
     """
-    # Create with all data including the past date
-    item_data = {**data, "due_date": past_date}
-
-    # Use model_construct to bypass validation
-    return ActionItem.model_construct(**item_data)
+    # Use model_construct to bypass validation; the call merges the kwargs
+    return ActionItem.model_construct(**data, due_date=past_date)
 
 
 def create_decision_with_past_date(
-    data: dict[str, Any], past_date: datetime, date_field: str = "review_date"
+    data: Mapping[str, Any], past_date: datetime, date_field: str = "review_date"
 ) -> Decision:
     """Create Decision with past implementation/review date for testing.
 
@@ -44,15 +42,12 @@ def create_decision_with_past_date(
     compromising production validation safety.
 
     Args:
-        data: Valid Decision data dictionary
+        data: Valid Decision data mapping, without the date_field key
         past_date: A datetime in the past to set as the specified date field
         date_field: Which date field to set ("review_date" or "implementation_date")
 
     Returns:
         Decision instance with past date set
     """
-    # Create with all data including the past date
-    decision_data = {**data, date_field: past_date}
-
-    # Use model_construct to bypass validation
-    return Decision.model_construct(**decision_data)
+    # Use model_construct to bypass validation; the call merges the kwargs
+    return Decision.model_construct(**data, **{date_field: past_date})